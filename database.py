@@ -1,3 +1,4 @@
+import asyncio
 import asyncpg
 import os
 import logging
@@ -6,15 +7,154 @@ from typing import Optional, Dict, Any, List
 import hashlib
 import time
 import secrets
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Normalizes English/Marathi priority labels; read-only so built once.
+_PRIORITY_MAP = MappingProxyType({
+    'Low': 'Low', 'कमी': 'Low',
+    'Medium': 'Medium', 'मध्यम': 'Medium',
+    'High': 'High', 'उच्च': 'High',
+    'Urgent': 'Urgent', 'तातडीचे': 'Urgent'
+})
+
+# === HOT-PATH SQL (module-level so the strings are built once) ===
+TICKET_INSERT_SQL = """
+    INSERT INTO public.grievancess (
+        ticket, employee_id, employee_name, mobile_number,
+        official_email, designation, department, office_name,
+        district_name, user_role, priority, issue_timestamp,
+        issue_category, issue_sub_category, issue_related,
+        issue_section, issue_sub_section, subject, description,
+        status, files_count, created_at, updated_at
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12,
+        $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, NOW()
+    ) RETURNING id, ticket
+"""
+
+# Exact match is the common case and can use a btree index on ticket;
+# the ILIKE '%...%' fallback (partial IDs) forces a scan, so it only
+# runs when the exact lookup finds nothing.
+TICKET_BY_ID_EXACT_SQL = """
+    SELECT * FROM public.grievancess
+    WHERE ticket = $1
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+TICKET_BY_ID_ILIKE_SQL = """
+    SELECT * FROM public.grievancess
+    WHERE ticket ILIKE $1
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+TICKET_BY_MOBILE_SQL = """
+    SELECT * FROM public.grievancess
+    WHERE mobile_number = $1
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+_TICKET_STATUS_COLUMNS = """id, ticket, employee_id, employee_name, mobile_number,
+           official_email, designation, department, office_name,
+           district_name, user_role, priority, issue_timestamp, issue_category,
+           issue_sub_category, issue_related, issue_section, issue_sub_section,
+           subject, description, status, created_at, updated_at"""
+
+# Exact and fuzzy match in one statement: exact hits sort first, and a miss
+# falls through to the ILIKE match without a second round trip.
+TICKET_STATUS_LOOKUP_SQL = f"""
+    SELECT {_TICKET_STATUS_COLUMNS}
+    FROM public.grievancess
+    WHERE ticket = $1 OR ticket ILIKE $2
+    ORDER BY (ticket = $1) DESC, created_at DESC
+    LIMIT 1
+"""
+
+TICKET_STATUS_MOBILE_SQL = f"""
+    SELECT {_TICKET_STATUS_COLUMNS}
+    FROM public.grievancess
+    WHERE mobile_number = $1
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+# Project only the columns callers actually use — SELECT * dragged the
+# full description text across the wire for every row.
+TICKETS_BY_PHONE_SQL = """
+    SELECT id, ticket, status, subject, priority, created_at, issue_category
+    FROM public.grievancess
+    WHERE mobile_number = $1
+    ORDER BY created_at DESC
+    LIMIT 50
+"""
+
+# Streaming variant: no LIMIT — rows are pulled through a server-side
+# cursor so the client never buffers the full result set.
+TICKETS_BY_PHONE_STREAM_SQL = """
+    SELECT id, ticket, status, subject, priority, created_at, issue_category
+    FROM public.grievancess
+    WHERE mobile_number = $1
+    ORDER BY created_at DESC
+"""
+
+# Column order for bulk COPY imports — callers must build their record
+# tuples in exactly this order.
+BULK_TICKET_COLUMNS = (
+    'ticket', 'employee_id', 'employee_name', 'mobile_number',
+    'official_email', 'designation', 'department', 'office_name',
+    'district_name', 'user_role', 'priority', 'issue_timestamp',
+    'issue_category', 'issue_sub_category', 'issue_related',
+    'issue_section', 'issue_sub_section', 'subject', 'description',
+    'status', 'files_count', 'created_at', 'updated_at'
+)
+
+# Async-insert buffering for WhatsApp burst traffic: inserts arriving within
+# the wait window are grouped into a single executemany round trip.
+ASYNC_INSERT_MAX_ROWS = 200
+ASYNC_INSERT_WAIT_TIME = 0.15  # seconds
+
+# Stats queries scan the whole grievancess table; dashboards poll them,
+# so a few seconds of staleness buys a lot of saved aggregation work.
+STATS_CACHE_TTL = 15.0  # seconds
+
+# Recent (identifier -> ticket row) memo for get_ticket_status re-polls
+STATUS_CACHE_TTL = 10.0  # seconds
+
+# Small LRU for per-phone ticket lists — a WhatsApp session re-queries the
+# same number several times within a chat turn
+MOBILE_CACHE_SIZE = 256
+MOBILE_CACHE_TTL = 5.0  # seconds
+
+# Plan reuse for the hot-path SQL above comes from asyncpg's built-in
+# per-connection prepared-statement LRU cache: passing the same query
+# string to fetch/fetchrow reuses the server-side plan after the first
+# call, so no explicit prepare step is needed.
+
 class DatabaseManager:
 
     def __init__(self):
         self.pool = None
+        self._insert_queue = asyncio.Queue()
+        self._flush_task = None
+        self._stats_cache = {}
+        self._status_cache = {}
+        self._mobile_cache: OrderedDict = OrderedDict()
+        # Entropy pool for ticket IDs — refilled in bulk so each ID costs
+        # a slice instead of an os.urandom syscall
+        self._id_buffer = b''
+        self._id_off = 0
+        self._id_lock = asyncio.Lock()
+        # Pool sizing is configurable so deployments can match worker concurrency;
+        # min defaults to max so the pool is fully warmed before traffic arrives.
+        self.pool_max_size = int(os.getenv('POSTGRES_POOL_MAX', '25'))
+        self.pool_min_size = int(os.getenv('POSTGRES_POOL_MIN', str(self.pool_max_size)))
         self.database_url = os.getenv('DATABASE_URL')
         if not self.database_url:
             user = os.getenv('POSTGRES_USER', '')
@@ -31,177 +171,181 @@ class DatabaseManager:
             return False
         
         try:
+            params = self._build_ticket_params(form_data, form_data.get('ticket', ''))
+
+            # Single statement — PostgreSQL auto-commits it, so an explicit
+            # transaction would only add BEGIN/COMMIT round-trips
             async with self.pool.acquire() as connection:
-                async with connection.transaction():
-                    ticket = form_data.get('ticket', '')
-                    employee_id = form_data.get('employee_id', '')
-                    employee_name = form_data.get('employee_name', 'Unknown')
-                    designation = form_data.get('designation', '')
-                    department = form_data.get('department', '')
-                    office_name = form_data.get('office_name', '')
-                    district_name = form_data.get('district_name', '')
-                    mobile_number = form_data.get('mobile_number', '')
-                    official_email = form_data.get('official_email', '')
-                    user_role = form_data.get('user_role', 'Employee')
-                    issue_category = form_data.get('issue_category', 'Other')
-                    issue_sub_category = form_data.get('issue_sub_category', '')
-                    subject = form_data.get('subject', 'No subject')
-                    description = form_data.get('description', 'No description')
-                    priority = form_data.get('priority', 'Low')
-                    status = form_data.get('status', 'Open')
-                    phone_number = form_data.get('phone_number', mobile_number)
-                    created_at = form_data.get('created_at', datetime.now())
-                    
-                    select_module = form_data.get('select_module', '')
-                    select_section = form_data.get('select_section', '')
-                    select_sub_section = form_data.get('select_sub_section', '')
-                    
-                    priority_map = {
-                        'Low': 'Low', 'कमी': 'Low',
-                        'Medium': 'Medium', 'मध्यम': 'Medium',
-                        'High': 'High', 'उच्च': 'High',
-                        'Urgent': 'Urgent', 'तातडीचे': 'Urgent'
-                    }
-                    priority_value = priority_map.get(priority, 'Low')
-                    
-                    full_description = description
-                    if select_module:
-                        full_description += f"\n\nModule: {select_module}"
-                    if select_section:
-                        full_description += f"\nSection: {select_section}"
-                    if select_sub_section:
-                        full_description += f"\nSub-Section: {select_sub_section}"
-                    
-                    ticket_query = """
-                        INSERT INTO public.grievancess (
-                            ticket, employee_id, employee_name, mobile_number, 
-                            official_email, designation, department, office_name,
-                            district_name, user_role, priority, issue_timestamp,
-                            issue_category, issue_sub_category, issue_related,
-                            issue_section, issue_sub_section, subject, description,
-                            status, files_count, created_at, updated_at
-                        ) VALUES (
-                            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12,
-                            $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, NOW()
-                        ) RETURNING id, ticket
-                    """
-                    
-                    ticket_result = await connection.fetchrow(
-                        ticket_query,
-                        ticket, employee_id, employee_name, mobile_number,
-                        official_email, designation, department, office_name,
-                        district_name or None, user_role, priority_value, created_at,
-                        issue_category, issue_sub_category or None,
-                        select_module or None, select_section or None,
-                        select_sub_section or None, subject, full_description,
-                        status, 0, created_at
-                    )
-                    
-                    ticket_db_id = ticket_result['id']
-                    returned_ticket = ticket_result['ticket']
-                    
-                    logger.info(f"✅ Ticket saved successfully: {returned_ticket} (DB ID: {ticket_db_id}, Role: {user_role}, Priority: {priority_value})")
-                    
-                    return True
-                    
+                ticket_result = await connection.fetchrow(TICKET_INSERT_SQL, *params)
+
+            ticket_db_id = ticket_result['id']
+            returned_ticket = ticket_result['ticket']
+
+            logger.info("✅ Ticket saved successfully: %s (DB ID: %s, Role: %s, Priority: %s)", returned_ticket, ticket_db_id, params[9], params[10])
+
+            self._stats_cache.clear()
+            self._status_cache.pop(params[3], None)  # mobile_number
+            return True
+
         except Exception as e:
-            logger.error(f"❌ Failed to save ticket: {e}", exc_info=True)
+            logger.error("❌ Failed to save ticket: %s", e)
             return False
+
+    def _build_ticket_params(self, form_data: dict, ticket: str,
+                             phone_number: str = None, default_priority: str = 'Low') -> tuple:
+        """Build the TICKET_INSERT_SQL parameter tuple shared by every insert path.
+
+        The form and WhatsApp save methods feed the same 22 columns; only
+        ticket-ID generation and a couple of defaults differ, so the tuple
+        is assembled in one place.
+        """
+        employee_id = form_data.get('employee_id', '')
+        employee_name = form_data.get('employee_name', 'Unknown')
+        mobile_number = form_data.get('mobile_number', phone_number or '')
+        official_email = form_data.get('official_email', '')
+        designation = form_data.get('designation', '')
+        department = form_data.get('department', '')
+        office_name = form_data.get('office_name', '')
+        district_name = form_data.get('district_name', '')
+        user_role = form_data.get('user_role', 'Employee')
+        issue_category = form_data.get('issue_category', 'Other')
+        issue_sub_category = form_data.get('issue_sub_category', '')
+        subject = form_data.get('subject', 'No subject')
+        description = form_data.get('description', 'No description')
+        priority = form_data.get('priority', default_priority)
+        status = form_data.get('status', 'Open')
+        # Naive datetime: issue_timestamp/created_at are TIMESTAMP without
+        # time zone in the schema, and asyncpg rejects aware values there
+        created_at = form_data.get('created_at', datetime.now())
+
+        select_module = form_data.get('select_module', '')
+        select_section = form_data.get('select_section', '')
+        select_sub_section = form_data.get('select_sub_section', '')
+
+        priority_value = _PRIORITY_MAP.get(priority, default_priority)
+
+        parts = [description]
+        if select_module:
+            parts.append(f"\n\nModule: {select_module}")
+        if select_section:
+            parts.append(f"\nSection: {select_section}")
+        if select_sub_section:
+            parts.append(f"\nSub-Section: {select_sub_section}")
+        full_description = "".join(parts)
+
+        return (
+            ticket, employee_id, employee_name, mobile_number,
+            official_email, designation, department, office_name,
+            district_name or None, user_role, priority_value, created_at,
+            issue_category, issue_sub_category or None,
+            select_module or None, select_section or None,
+            select_sub_section or None, subject, full_description,
+            status, 0, created_at
+        )
     
+    async def _next_ticket_id(self) -> str:
+        """Return the next TKT-xxxxxxxx ID from a pre-generated entropy pool.
+
+        One os.urandom(4096) refill serves ~1024 tickets, versus one kernel
+        CSPRNG syscall per ticket with secrets.token_hex. The entropy source
+        is the same, so uniqueness guarantees are unchanged.
+        """
+        async with self._id_lock:
+            if self._id_off + 4 > len(self._id_buffer):
+                self._id_buffer = os.urandom(4096)
+                self._id_off = 0
+            chunk = self._id_buffer[self._id_off:self._id_off + 4]
+            self._id_off += 4
+        return f"TKT-{chunk.hex()}"
+
     async def save_whatsapp_ticket(self, form_data: dict, phone_number: str) -> str:
-        """Save WhatsApp form submission to grievancess table - SHORT FORMAT"""
+        """Save WhatsApp form submission to grievancess table - SHORT FORMAT
+
+        Inserts are buffered and flushed in batches by _flush_loop so burst
+        traffic shares one round trip instead of one transaction per message.
+        """
         if not self.pool:
             logger.error("❌ Database pool not initialized")
             raise Exception("Database not available")
-        
+
         try:
-            logger.info(f"📝 Starting WhatsApp ticket save for phone: {phone_number}")
-            
-            async with self.pool.acquire() as connection:
-                async with connection.transaction():
-                    # Generate unique ticket ID - SHORT FORMAT (8 chars)
-                    unique_id = secrets.token_hex(4)  # Generates 8 hex characters
-                    ticket = f"TKT-{unique_id}"
-                    
-                    logger.info(f"🎫 Generated ticket ID: {ticket}")
-                    
-                    # Prepare data
-                    employee_name = form_data.get('employee_name', 'Unknown')
-                    employee_id = form_data.get('employee_id', '')
-                    mobile_number = form_data.get('mobile_number', phone_number)
-                    official_email = form_data.get('official_email', '')
-                    designation = form_data.get('designation', '')
-                    department = form_data.get('department', '')
-                    office_name = form_data.get('office_name', '')
-                    district_name = form_data.get('district_name', '')
-                    user_role = form_data.get('user_role', 'Employee')
-                    issue_category = form_data.get('issue_category', 'Other')
-                    issue_sub_category = form_data.get('issue_sub_category', '')
-                    
-                    select_module = form_data.get('select_module', '')
-                    select_section = form_data.get('select_section', '')
-                    select_sub_section = form_data.get('select_sub_section', '')
-                    
-                    subject = form_data.get('subject', 'No subject')
-                    description = form_data.get('description', 'No description')
-                    priority = form_data.get('priority', 'Medium')
-                    
-                    priority_map = {
-                        'Low': 'Low', 'कमी': 'Low',
-                        'Medium': 'Medium', 'मध्यम': 'Medium',
-                        'High': 'High', 'उच्च': 'High',
-                        'Urgent': 'Urgent', 'तातडीचे': 'Urgent'
-                    }
-                    priority_value = priority_map.get(priority, 'Medium')
-                    
-                    full_description = description
-                    if select_module:
-                        full_description += f"\n\nModule: {select_module}"
-                    if select_section:
-                        full_description += f"\nSection: {select_section}"
-                    if select_sub_section:
-                        full_description += f"\nSub-Section: {select_sub_section}"
-                    
-                    logger.info(f"📊 Ticket data prepared - Category: {issue_category}, SubCat: {issue_sub_category}, Module: {select_module}")
-                    
-                    # Insert into grievancess table
-                    grievances_query = """
-                        INSERT INTO public.grievancess (
-                            ticket, employee_id, employee_name, mobile_number, 
-                            official_email, designation, department, office_name,
-                            district_name, user_role, priority, issue_timestamp,
-                            issue_category, issue_sub_category, issue_related,
-                            issue_section, issue_sub_section, subject, description,
-                            status, files_count, created_at, updated_at
-                        ) VALUES (
-                            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12,
-                            $13, $14, $15, $16, $17, $18, $19, $20, $21, NOW(), NOW()
-                        ) RETURNING id, ticket
-                    """
-                    
-                    logger.info(f"💾 Executing INSERT query...")
-                    
-                    ticket_result = await connection.fetchrow(
-                        grievances_query,
-                        ticket, employee_id, employee_name, mobile_number,
-                        official_email, designation, department, office_name,
-                        district_name or None, user_role, priority_value,
-                        datetime.now(), issue_category, issue_sub_category or None,
-                        select_module or None, select_section or None,
-                        select_sub_section or None, subject, full_description,
-                        'Open', 0
-                    )
-                    
-                    ticket_db_id = ticket_result['id']
-                    returned_ticket = ticket_result['ticket']
-                    
-                    logger.info(f"✅ WhatsApp ticket saved to grievancess table: {returned_ticket} (DB ID: {ticket_db_id}, Role: {user_role}, Priority: {priority_value})")
-                    
-                    return returned_ticket
-                    
+            logger.debug("📝 Starting WhatsApp ticket save for phone: %s", phone_number)
+
+            # Generate unique ticket ID - SHORT FORMAT (8 hex chars)
+            ticket = await self._next_ticket_id()
+
+            logger.info("🎫 Generated ticket ID: %s", ticket)
+
+            params = self._build_ticket_params(form_data, ticket,
+                                               phone_number=phone_number,
+                                               default_priority='Medium')
+
+            logger.debug("📊 Ticket data prepared - Category: %s, SubCat: %s, Module: %s", params[12], params[13], params[14])
+
+            # Enqueue for the batched flush and wait for the insert to land
+            future = asyncio.get_running_loop().create_future()
+            await self._insert_queue.put((params, ticket, future))
+            await future
+
+            # The cached per-phone ticket list is now stale
+            self._mobile_cache.pop(phone_number, None)
+            self._mobile_cache.pop(params[3], None)
+
+            logger.info("✅ WhatsApp ticket saved to grievancess table: %s (Role: %s, Priority: %s)", ticket, params[9], params[10])
+
+            return ticket
+
         except Exception as e:
-            logger.error(f"❌ Failed to save WhatsApp ticket: {e}", exc_info=True)
+            logger.error("❌ Failed to save WhatsApp ticket: %s", e)
             raise Exception(f"Database save failed: {str(e)}")
+
+    async def _flush_loop(self):
+        """Drain queued WhatsApp inserts into batched executemany calls.
+
+        Groups rows arriving within ASYNC_INSERT_WAIT_TIME (up to
+        ASYNC_INSERT_MAX_ROWS) into one INSERT batch so parse/plan/WAL-fsync
+        cost amortizes across the batch.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._insert_queue.get()]
+            try:
+                deadline = loop.time() + ASYNC_INSERT_WAIT_TIME
+                while len(batch) < ASYNC_INSERT_MAX_ROWS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._insert_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                async with self.pool.acquire() as connection:
+                    async with connection.transaction():
+                        await connection.executemany(
+                            TICKET_INSERT_SQL,
+                            [params for params, _, _ in batch]
+                        )
+                logger.info("💾 Flushed batch of %d WhatsApp ticket(s)", len(batch))
+                self._stats_cache.clear()
+                for params, _, _ in batch:
+                    self._status_cache.pop(params[3], None)  # mobile_number
+                for _, ticket, future in batch:
+                    if not future.done():
+                        future.set_result(ticket)
+            except asyncio.CancelledError:
+                # Shutdown landed mid-batch: fail these futures so their
+                # callers don't hang; close_pool flushes whatever is still
+                # queued afterwards.
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(Exception("Database shutting down"))
+                raise
+            except Exception as e:
+                logger.error("❌ Batch insert failed (%d rows): %s", len(batch), e)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
     
     async def get_ticket_by_id(self, ticket: str) -> Optional[Dict[str, Any]]:
         """Get ticket by unique ID from grievancess table"""
@@ -211,24 +355,19 @@ class DatabaseManager:
         
         try:
             async with self.pool.acquire() as connection:
-                query = """
-                    SELECT * FROM public.grievancess 
-                    WHERE ticket = $1 OR ticket ILIKE $2
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                
-                result = await connection.fetchrow(query, ticket, f"%{ticket}%")
+                result = await connection.fetchrow(TICKET_BY_ID_EXACT_SQL, ticket)
+                if not result:
+                    result = await connection.fetchrow(TICKET_BY_ID_ILIKE_SQL, f"%{ticket}%")
                 
                 if result:
-                    logger.info(f"✅ Ticket found in grievancess table: {ticket}")
+                    logger.info("✅ Ticket found in grievancess table: %s", ticket)
                     return dict(result)
                 else:
-                    logger.info(f"❌ Ticket not found: {ticket}")
+                    logger.info("❌ Ticket not found: %s", ticket)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error fetching ticket: {e}")
+            logger.error("Error fetching ticket: %s", e)
             return None
 
     async def get_ticket_by_mobile(self, mobile_number: str) -> Optional[Dict[str, Any]]:
@@ -239,243 +378,365 @@ class DatabaseManager:
         
         try:
             async with self.pool.acquire() as connection:
-                query = """
-                    SELECT * FROM public.grievancess 
-                    WHERE mobile_number = $1
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                
-                result = await connection.fetchrow(query, mobile_number)
+                result = await connection.fetchrow(TICKET_BY_MOBILE_SQL, mobile_number)
                 
                 if result:
-                    logger.info(f"✅ Ticket found for mobile in grievancess table: {mobile_number}")
+                    logger.info("✅ Ticket found for mobile in grievancess table: %s", mobile_number)
                     return dict(result)
                 else:
-                    logger.info(f"❌ No ticket found for mobile: {mobile_number}")
+                    logger.info("❌ No ticket found for mobile: %s", mobile_number)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error fetching ticket by mobile: {e}")
+            logger.error("Error fetching ticket by mobile: %s", e)
             return None
 
     async def get_ticket_status(self, identifier: str) -> Optional[Dict[str, Any]]:
-        """Get ticket status using ticket ID or mobile_number from grievancess table"""
+        """Get ticket status using ticket ID or mobile_number from grievancess table
+
+        Users re-poll the same identifier during a chat session, so results
+        are memoized for STATUS_CACHE_TTL seconds to collapse the repeats.
+        """
         if not self.pool:
             return None
-        
+
         try:
             identifier = identifier.strip()
-            
+
+            cached = self._status_cache.get(identifier)
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+
             async with self.pool.acquire() as connection:
-                query = """
-                    SELECT id, ticket, employee_id, employee_name, mobile_number,
-                           official_email, designation, department, office_name,
-                           district_name, user_role, priority, issue_timestamp, issue_category,
-                           issue_sub_category, issue_related, issue_section, issue_sub_section,
-                           subject, description, status, created_at, updated_at
-                    FROM public.grievancess
-                    WHERE (ticket = $1 OR ticket ILIKE $2 OR mobile_number = $1)
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """
-                
-                result = await connection.fetchrow(query, identifier, f"%{identifier}%")
-                
+                if identifier.isdigit() and len(identifier) >= 10:
+                    result = await connection.fetchrow(TICKET_STATUS_MOBILE_SQL, identifier)
+                else:
+                    result = await connection.fetchrow(TICKET_STATUS_LOOKUP_SQL, identifier, f"%{identifier}%")
+
                 if not result:
                     return None
-                
+
                 ticket_data = dict(result)
-                
-                status_map = {
-                    'Open': 'Open',
-                    'In Progress': 'In Progress',
-                    'Resolved': 'Resolved',
-                    'Closed': 'Closed',
-                    'Pending': 'Pending'
-                }
-                
-                current_status = ticket_data.get('status', 'Open')
-                ticket_data['status'] = status_map.get(current_status, current_status)
-                
+
+                if len(self._status_cache) > 1024:
+                    now = time.monotonic()
+                    for key in [k for k, v in self._status_cache.items() if v[1] <= now]:
+                        del self._status_cache[key]
+                self._status_cache[identifier] = (ticket_data, time.monotonic() + STATUS_CACHE_TTL)
+
                 return ticket_data
-                
+
         except Exception as e:
-            logger.error(f"Error in get_ticket_status: {str(e)}")
+            logger.error("Error in get_ticket_status: %s", e)
             return None
         
-    async def get_tickets_by_phone(self, phone_number: str) -> List[Dict[str, Any]]:
-        """Get all tickets for a phone number from grievancess table"""
+    async def get_tickets_by_phone(self, phone_number: str) -> List[asyncpg.Record]:
+        """Get all tickets for a phone number from grievancess table
+
+        Returns asyncpg Records directly — they already support dict-style
+        access, so copying each row into a fresh dict is pure overhead.
+        """
         if not self.pool:
             logger.error("Database pool not initialized")
             return []
-        
+
+        cached = self._mobile_cache.get(phone_number)
+        if cached and time.monotonic() < cached[1]:
+            self._mobile_cache.move_to_end(phone_number)
+            return cached[0]
+
         try:
             async with self.pool.acquire() as connection:
-                query = """
-                    SELECT * FROM public.grievancess
-                    WHERE mobile_number = $1
-                    ORDER BY created_at DESC
-                    LIMIT 50
-                """
-                
-                results = await connection.fetch(query, phone_number)
-                tickets = [dict(row) for row in results]
-                logger.info(f"Found {len(tickets)} tickets for phone {phone_number}")
-                
-                return tickets
-                
+                results = await connection.fetch(TICKETS_BY_PHONE_SQL, phone_number)
+                logger.info("Found %d tickets for phone %s", len(results), phone_number)
+
+                self._mobile_cache[phone_number] = (results, time.monotonic() + MOBILE_CACHE_TTL)
+                self._mobile_cache.move_to_end(phone_number)
+                while len(self._mobile_cache) > MOBILE_CACHE_SIZE:
+                    self._mobile_cache.popitem(last=False)
+
+                return results
+
         except Exception as e:
-            logger.error(f"Error fetching tickets by phone: {e}")
+            logger.error("Error fetching tickets by phone: %s", e)
             return []
 
+    def _get_cached_stats(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached stats for key if still within STATS_CACHE_TTL"""
+        entry = self._stats_cache.get(key)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _set_cached_stats(self, key: str, stats: Dict[str, Any]):
+        """Cache stats for key with TTL expiry"""
+        self._stats_cache[key] = (stats, time.monotonic() + STATS_CACHE_TTL)
+
+    async def bulk_save_tickets(self, records: List[tuple]) -> int:
+        """Bulk-insert tickets using PostgreSQL's COPY protocol
+
+        For imports/backfills this streams all rows in one COPY instead of
+        paying parse/plan/round-trip per INSERT. Each record must follow
+        BULK_TICKET_COLUMNS order. Returns the number of rows copied.
+        """
+        if not self.pool:
+            logger.error("Database pool not initialized")
+            return 0
+        if not records:
+            return 0
+
+        try:
+            async with self.pool.acquire() as connection:
+                await connection.copy_records_to_table(
+                    'grievancess',
+                    records=records,
+                    columns=list(BULK_TICKET_COLUMNS),
+                    schema_name='public'
+                )
+
+            self._stats_cache.clear()
+            logger.info("📦 Bulk-imported %d tickets via COPY", len(records))
+            return len(records)
+
+        except Exception as e:
+            logger.error("Error bulk saving tickets: %s", e)
+            return 0
+
+    async def stream_tickets_by_phone(self, phone_number: str):
+        """Stream tickets for a phone number via a server-side cursor
+
+        asyncpg's cursor keeps the result set in a server-side portal, so
+        memory per request stays bounded regardless of how many tickets a
+        number has — use this instead of get_tickets_by_phone for large
+        or uncapped listings.
+        """
+        if not self.pool:
+            logger.error("Database pool not initialized")
+            return
+
+        async with self.pool.acquire() as connection:
+            async with connection.transaction():
+                async for row in connection.cursor(TICKETS_BY_PHONE_STREAM_SQL, phone_number):
+                    yield dict(row)
+
     async def get_ticket_stats(self) -> Dict[str, Any]:
         """Get comprehensive ticket statistics from grievancess table"""
         if not self.pool:
             return {"error": "Database not available"}
-        
+
+        cached = self._get_cached_stats('tickets')
+        if cached is not None:
+            return cached
+
         try:
             async with self.pool.acquire() as connection:
                 stats_query = """
-                    SELECT 
+                    SELECT
                         COUNT(*) as total_tickets,
-                        COUNT(CASE WHEN status = 'Open' THEN 1 END) as open_tickets,
-                        COUNT(CASE WHEN status = 'In Progress' THEN 1 END) as in_progress_tickets,
-                        COUNT(CASE WHEN status = 'Resolved' THEN 1 END) as resolved_tickets,
-                        COUNT(CASE WHEN status = 'Closed' THEN 1 END) as closed_tickets,
-                        COUNT(CASE WHEN DATE(created_at) >= CURRENT_DATE - INTERVAL '7 days' THEN 1 END) as recent_7days
+                        COUNT(*) FILTER (WHERE status = 'Open') as open_tickets,
+                        COUNT(*) FILTER (WHERE status = 'In Progress') as in_progress_tickets,
+                        COUNT(*) FILTER (WHERE status = 'Resolved') as resolved_tickets,
+                        COUNT(*) FILTER (WHERE status = 'Closed') as closed_tickets,
+                        COUNT(*) FILTER (WHERE DATE(created_at) >= CURRENT_DATE - INTERVAL '7 days') as recent_7days
                     FROM public.grievancess
                 """
-    
+
                 result = await connection.fetchrow(stats_query)
                 stats = dict(result) if result else {}
-                
+
+                self._set_cached_stats('tickets', stats)
                 return stats
-                
+
         except Exception as e:
-            logger.error(f"Error getting ticket stats: {e}")
+            logger.error("Error getting ticket stats: %s", e)
             return {"error": str(e)}
 
     async def get_whatsapp_ticket_stats(self) -> Dict[str, Any]:
         """Get WhatsApp specific ticket statistics from grievancess table"""
         if not self.pool:
             return {"error": "Database not available"}
-        
+
+        cached = self._get_cached_stats('whatsapp')
+        if cached is not None:
+            return cached
+
         try:
             async with self.pool.acquire() as connection:
                 whatsapp_stats_query = """
-                    SELECT 
+                    SELECT
                         COUNT(*) as total_whatsapp_tickets,
-                        COUNT(CASE WHEN status = 'Open' THEN 1 END) as open_whatsapp,
-                        COUNT(CASE WHEN status = 'In Progress' THEN 1 END) as in_progress_whatsapp,
-                        COUNT(CASE WHEN status = 'Resolved' THEN 1 END) as resolved_whatsapp,
-                        COUNT(CASE WHEN status = 'Closed' THEN 1 END) as closed_whatsapp,
-                        COUNT(CASE WHEN DATE(created_at) >= CURRENT_DATE - INTERVAL '7 days' THEN 1 END) as recent_whatsapp_7days
+                        COUNT(*) FILTER (WHERE status = 'Open') as open_whatsapp,
+                        COUNT(*) FILTER (WHERE status = 'In Progress') as in_progress_whatsapp,
+                        COUNT(*) FILTER (WHERE status = 'Resolved') as resolved_whatsapp,
+                        COUNT(*) FILTER (WHERE status = 'Closed') as closed_whatsapp,
+                        COUNT(*) FILTER (WHERE DATE(created_at) >= CURRENT_DATE - INTERVAL '7 days') as recent_whatsapp_7days
                     FROM public.grievancess
                     WHERE ticket LIKE 'TKT-%'
                 """
-                
+
                 result = await connection.fetchrow(whatsapp_stats_query)
-                return dict(result) if result else {"total_whatsapp_tickets": 0}
+                stats = dict(result) if result else {"total_whatsapp_tickets": 0}
+                self._set_cached_stats('whatsapp', stats)
+                return stats
                     
         except Exception as e:
-            logger.error(f"Error getting WhatsApp ticket stats: {e}")
+            logger.error("Error getting WhatsApp ticket stats: %s", e)
             return {"error": str(e)}
 
     async def init_pool(self):
         """Initialize asyncpg connection pool with enhanced logging"""
         try:
             logger.info("🔌 Initializing database connection pool...")
-            logger.info(f"📍 Database URL: {self.database_url.split('@')[1] if '@' in self.database_url else 'Unknown'}")
+            logger.debug("📍 Database URL: %s", self.database_url.split('@')[1] if '@' in self.database_url else 'Unknown')
             
             self.pool = await asyncpg.create_pool(
                 self.database_url,
-                min_size=1,
-                max_size=10,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                max_queries=50000,
+                max_inactive_connection_lifetime=300,
                 command_timeout=60,
-                server_settings={'application_name': 'maha_aastha_chatbot'}
+                server_settings={
+                    'application_name': 'maha_aastha_chatbot',
+                    # JIT only helps long analytical queries; on short OLTP
+                    # inserts it causes a ~300ms first-call compile spike.
+                    'jit': 'off'
+                }
             )
             
             async with self.pool.acquire() as conn:
-                # Get current database name
-                current_db = await conn.fetchval("SELECT current_database()")
-                version = await conn.fetchval("SELECT version()")
-                
+                # One pipelined round-trip for all schema introspection
+                # instead of ~8 sequential fetchval calls
+                info = await conn.fetchrow("""
+                    SELECT current_database() AS current_db,
+                           version() AS pg_version,
+                           EXISTS (
+                               SELECT FROM information_schema.tables
+                               WHERE table_schema = 'public'
+                               AND table_name = 'grievancess'
+                           ) AS table_exists,
+                           ARRAY(
+                               SELECT column_name::text
+                               FROM information_schema.columns
+                               WHERE table_schema = 'public'
+                               AND table_name = 'grievancess'
+                           ) AS columns
+                """)
+                current_db = info['current_db']
+                columns = set(info['columns'])
+
                 logger.info(f"✅ Database connection pool initialized")
-                logger.info(f"📊 PostgreSQL Version: {version.split(',')[0]}")
+                logger.info(f"📊 PostgreSQL Version: {info['pg_version'].split(',')[0]}")
                 logger.info(f"🗄️  Connected to database: {current_db}")
-                
-                # Test if grievancess table exists
-                table_exists = await conn.fetchval("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = 'grievancess'
-                    )
-                """)
-                
-                if table_exists:
+
+                if info['table_exists']:
                     logger.info("✅ grievancess table exists and ready")
-                    
-                    # Count total columns
-                    column_count = await conn.fetchval("""
-                        SELECT COUNT(*) 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = 'grievancess'
-                    """)
-                    logger.info(f"✅ grievancess table has {column_count} columns")
-                    
-                    # Check if ticket column exists
-                    ticket_column_exists = await conn.fetchval("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.columns 
-                            WHERE table_schema = 'public' 
-                            AND table_name = 'grievancess' 
-                            AND column_name = 'ticket'
-                        )
-                    """)
-                    
-                    if ticket_column_exists:
+                    logger.info(f"✅ grievancess table has {len(columns)} columns")
+
+                    if 'ticket' in columns:
                         logger.info("✅ Ticket column exists in grievancess table")
                     else:
                         logger.error("❌ CRITICAL: Ticket column NOT found in grievancess table!")
-                    
+
                     # Check if NEW subcategory columns exist
                     subcategory_columns = ['issue_related', 'issue_section', 'issue_sub_section']
+                    missing_columns = [col for col in subcategory_columns if col not in columns]
                     for col in subcategory_columns:
-                        col_exists = await conn.fetchval("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.columns 
-                                WHERE table_schema = 'public' 
-                                AND table_name = 'grievancess' 
-                                AND column_name = $1
-                            )
-                        """, col)
-                        
-                        if col_exists:
+                        if col in columns:
                             logger.info(f"✅ Column '{col}' exists in grievancess table")
                         else:
                             logger.warning(f"⚠️  Column '{col}' NOT found in grievancess table! Creating it...")
-                            try:
-                                await conn.execute(f"""
-                                    ALTER TABLE public.grievancess 
-                                    ADD COLUMN IF NOT EXISTS {col} TEXT
-                                """)
-                                logger.info(f"✅ Column '{col}' created successfully")
-                            except Exception as e:
-                                logger.error(f"❌ Failed to create column '{col}': {e}")
+                    if missing_columns:
+                        try:
+                            # One multi-statement execute for all missing columns
+                            await conn.execute("; ".join(
+                                f"ALTER TABLE public.grievancess ADD COLUMN IF NOT EXISTS {col} TEXT"
+                                for col in missing_columns
+                            ))
+                            logger.info(f"✅ Created missing columns: {', '.join(missing_columns)}")
+                        except Exception as e:
+                            logger.error(f"❌ Failed to create columns {missing_columns}: {e}")
+
+                    await self._ensure_indexes(conn)
                 else:
                     logger.error("❌ CRITICAL: grievancess table NOT FOUND!")
                     logger.error(f"❌ Current database: {current_db}")
                     logger.error("❌ Please create the grievancess table or check DATABASE_URL")
-                    
+
+            # Start the background flusher for batched WhatsApp inserts
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_loop())
+                logger.info("✅ WhatsApp insert flush loop started")
+
         except Exception as e:
             logger.error(f"❌ Failed to initialize database pool: {e}", exc_info=True)
             raise Exception("Database pool initialization failed")
 
+    async def _ensure_indexes(self, conn):
+        """Create the indexes backing the hot lookup patterns.
+
+        The schema already indexes ticket and mobile_number on their own;
+        this adds the composite (mobile_number, created_at DESC) index so
+        latest-ticket-per-mobile lookups skip the sort, and the trigram
+        index keeps the ILIKE fallback off a sequential scan. Each
+        statement is guarded so a missing extension or privilege never
+        blocks startup.
+        """
+        index_statements = [
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS grievancess_mobile_created_idx "
+            "ON public.grievancess (mobile_number, created_at DESC)",
+        ]
+        try:
+            await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            index_statements.append(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS grievancess_ticket_trgm_idx "
+                "ON public.grievancess USING gin (ticket gin_trgm_ops)"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  pg_trgm extension unavailable, skipping trigram index: {e}")
+
+        for statement in index_statements:
+            try:
+                await conn.execute(statement)
+            except Exception as e:
+                logger.warning(f"⚠️  Index creation skipped: {e}")
+        logger.info("✅ Lookup indexes ensured on grievancess table")
+
     async def close_pool(self):
         """Close the connection pool gracefully"""
+        if self._flush_task:
+            task, self._flush_task = self._flush_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        # Flush anything still queued so in-flight save_whatsapp_ticket
+        # awaits resolve instead of hanging across shutdown.
+        remaining = []
+        while not self._insert_queue.empty():
+            remaining.append(self._insert_queue.get_nowait())
+        if remaining:
+            try:
+                if not self.pool:
+                    raise Exception("Database pool already closed")
+                async with self.pool.acquire() as connection:
+                    async with connection.transaction():
+                        await connection.executemany(
+                            TICKET_INSERT_SQL,
+                            [params for params, _, _ in remaining]
+                        )
+                logger.info("💾 Flushed %d queued WhatsApp ticket(s) on shutdown", len(remaining))
+                for _, ticket, future in remaining:
+                    if not future.done():
+                        future.set_result(ticket)
+            except Exception as e:
+                logger.error("❌ Shutdown flush failed (%d rows): %s", len(remaining), e)
+                for _, _, future in remaining:
+                    if not future.done():
+                        future.set_exception(e)
+
         if self.pool:
             await self.pool.close()
             logger.info("Database connection pool closed")
@@ -506,16 +767,13 @@ class DatabaseManager:
                 except Exception:
                     conn_count = 0
                 
-                pool_info = {}
-                try:
-                    pool_info = {
-                        "pool_max_size": getattr(self.pool, '_maxsize', 'unknown'),
-                        "pool_min_size": getattr(self.pool, '_minsize', 'unknown'),
-                        "pool_current_size": len(getattr(self.pool, '_con', []))
-                            if hasattr(self.pool, '_con') else 'unknown'
-                    }
-                except Exception:
-                    pool_info = {"pool_info": "unavailable"}
+                # Public pool accessors are O(1) and don't poke at asyncpg internals
+                pool_info = {
+                    "pool_max_size": self.pool.get_max_size(),
+                    "pool_min_size": self.pool.get_min_size(),
+                    "pool_current_size": self.pool.get_size(),
+                    "pool_idle": self.pool.get_idle_size()
+                }
                 
                 return {
                     "connected": True,
@@ -611,6 +869,15 @@ async def get_ticket_by_mobile(mobile_number: str) -> Optional[Dict[str, Any]]:
     """Get latest ticket by mobile number (wrapper)"""
     return await db_manager.get_ticket_by_mobile(mobile_number)
 
-async def get_tickets_by_phone(phone_number: str) -> List[Dict[str, Any]]:
+async def get_tickets_by_phone(phone_number: str) -> List[asyncpg.Record]:
     """Get all tickets for a phone number (wrapper)"""
-    return await db_manager.get_tickets_by_phone(phone_number)
\ No newline at end of file
+    return await db_manager.get_tickets_by_phone(phone_number)
+
+async def stream_tickets_by_phone(phone_number: str):
+    """Stream tickets for a phone number (wrapper)"""
+    async for ticket in db_manager.stream_tickets_by_phone(phone_number):
+        yield ticket
+
+async def bulk_save_tickets(records: List[tuple]) -> int:
+    """Bulk-insert tickets via COPY (wrapper)"""
+    return await db_manager.bulk_save_tickets(records)
\ No newline at end of file
@@ -1,14 +1,23 @@
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, field_validator, ValidationError
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, StringConstraints, ValidationError
+from typing import Annotated, Literal, Optional, List, Dict, Any
+import asyncio
 import time
 import os
 import logging
+import queue
 import re
+import secrets
 import csv
 import io
+import json
+import orjson
+import threading
+from collections import Counter, deque, OrderedDict
+from itertools import islice
+from cachetools import TTLCache
 from datetime import datetime
 from contextlib import asynccontextmanager
 from database import (
@@ -17,8 +26,11 @@ from database import (
     close_database,
     get_ticket_status,
     get_tickets_by_phone,
+    stream_tickets_by_phone,
+    bulk_save_tickets,
     test_db_connection,
-    get_db_info
+    get_db_info,
+    _PRIORITY_MAP
 )
 
 # === CONFIGURATION ===
@@ -30,21 +42,40 @@ logger.setLevel(logging.INFO)
 
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Console handler
+# Console handler (attached behind the log queue below so stderr writes also
+# happen off the request threads)
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
-# Rotating file handler (keeps logs in chatbot.log)
+# Rotating file handler (keeps logs in chatbot.log), decoupled from request
+# threads via a queue: emit() only enqueues, and a background listener thread
+# performs the actual stat/write/rotate so endpoints never block on I/O.
 try:
-    from logging.handlers import RotatingFileHandler
+    from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener, MemoryHandler
+    import atexit
     file_handler = RotatingFileHandler(LOG_FILENAME, maxBytes=5 * 1024 * 1024, backupCount=5, encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Buffer records in memory and flush them to disk in batches so a burst of
+    # chat lines costs one write() instead of one per record. Errors flush
+    # immediately, and a 1s timer bounds how long a record can sit buffered.
+    _memory_handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+    _log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(_log_queue, console_handler, _memory_handler, respect_handler_level=True)
+    _log_listener.start()
+
+    def _flush_log_buffer():
+        while True:
+            time.sleep(1.0)
+            _memory_handler.flush()
+
+    threading.Thread(target=_flush_log_buffer, daemon=True, name="log-flush").start()
+    atexit.register(_log_listener.stop)
+    logger.addHandler(QueueHandler(_log_queue))
 except Exception as e:
-    # Fallback to simple FileHandler if RotatingFileHandler not available for some reason
+    # Fallback to direct handlers if the queue-based setup fails for some reason
+    logger.addHandler(console_handler)
     fh = logging.FileHandler(LOG_FILENAME, encoding='utf-8')
     fh.setLevel(logging.INFO)
     fh.setFormatter(formatter)
@@ -55,15 +86,24 @@ logger.propagate = False
 # Helper to log chat interactions in a consistent format
 def log_chat(session_id: Optional[str], user_input: str, assistant_reply: str, language: str = 'en', endpoint: str = '/query/'):
     """Write a concise single-line log for each chat interaction."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
         sid = session_id if session_id else 'N/A'
-        # Keep the logged lines compact but informative
-        logger.info(f"[CHAT] endpoint={endpoint} session_id={sid} language={language} user_input={user_input} assistant_reply={assistant_reply}")
+        # Keep the logged lines compact but informative; %s-style args defer
+        # formatting until a handler actually emits the record
+        logger.info(
+            "[CHAT] endpoint=%s session_id=%s language=%s user_input=%s assistant_reply=%s",
+            endpoint, sid, language, user_input, assistant_reply
+        )
     except Exception as e:
         logger.error(f"Failed to write chat log: {e}")
 
 RATE_LIMIT_SECONDS = 2
 SUPPORTED_LANGUAGES = ["en", "mr"]
+# frozenset for the per-request membership check; the list above stays for
+# ordered display in status payloads.
+_SUPPORTED_LANGUAGES_SET = frozenset(SUPPORTED_LANGUAGES)
 
 SYSTEM_STATUS = {
     "startup_time": time.time(),
@@ -75,71 +115,88 @@ SYSTEM_STATUS = {
     "database_connected": False
 }
 
-# Global in-memory stores (in production, use Redis or similar)
-CHAT_HISTORY = {}
-USER_SESSION_STATE = {}
-RATINGS_DATA = []
-RATE_LIMIT_TRACKER = {}
+# Global in-memory stores (in production, use Redis or similar). Bounded so
+# long-running processes cannot grow them without limit: idle sessions expire
+# from the TTL caches and the ratings buffer keeps the most recent entries.
+CHAT_HISTORY = TTLCache(maxsize=10_000, ttl=3600)
+USER_SESSION_STATE = TTLCache(maxsize=10_000, ttl=1800)
+RATINGS_DATA = deque(maxlen=10_000)
+
+# Running aggregates over every rating this process has accepted, updated at
+# submission time so /ratings/stats stays O(1) however long the history gets.
+RATING_STATS = {"count": 0, "sum": 0, "ratings": Counter(), "languages": Counter()}
+
+# Rate limiter keyed exactly by session_id: an entry lives for
+# RATE_LIMIT_SECONDS and its presence means the session already sent a
+# message inside the window. TTL expiry prunes idle sessions, matching the
+# other bounded stores in this file.
+_RATE_LIMIT_SEEN = TTLCache(maxsize=10_000, ttl=RATE_LIMIT_SECONDS)
+
+def check_rate_limit(session_id: str) -> bool:
+    """Return True if this session may proceed, False if it is rate limited."""
+    if session_id in _RATE_LIMIT_SEEN:
+        return False
+    _RATE_LIMIT_SEEN[session_id] = True
+    return True
+
+# Short-TTL memo for the DB probes behind /, /health/ and /database/stats/.
+# Load balancers poll these endpoints about once a second, and each hit cost
+# a SELECT 1 plus pool introspection; a 5s cache keeps one probe in flight.
+_DB_PROBE_TTL = 5.0
+_db_info_cache = {"value": None, "expires": 0.0}
+_db_conn_cache = {"value": False, "expires": 0.0}
+_db_probe_lock = asyncio.Lock()
+
+async def get_cached_db_info() -> Dict[str, Any]:
+    """get_db_info() memoized for _DB_PROBE_TTL seconds."""
+    if time.monotonic() < _db_info_cache["expires"]:
+        return _db_info_cache["value"]
+    async with _db_probe_lock:
+        if time.monotonic() < _db_info_cache["expires"]:
+            return _db_info_cache["value"]
+        value = await get_db_info()
+        _db_info_cache["value"] = value
+        _db_info_cache["expires"] = time.monotonic() + _DB_PROBE_TTL
+        return value
+
+async def cached_test_db_connection() -> bool:
+    """test_db_connection() memoized for _DB_PROBE_TTL seconds."""
+    if time.monotonic() < _db_conn_cache["expires"]:
+        return _db_conn_cache["value"]
+    async with _db_probe_lock:
+        if time.monotonic() < _db_conn_cache["expires"]:
+            return _db_conn_cache["value"]
+        value = await test_db_connection()
+        _db_conn_cache["value"] = value
+        _db_conn_cache["expires"] = time.monotonic() + _DB_PROBE_TTL
+        return value
 
 # === MODELS & VALIDATION ===
+# Constrained types run in pydantic-core's Rust validation path, replacing the
+# Python-level @field_validator hooks the models used before.
+InputText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
 class QueryRequest(BaseModel):
-    input_text: str
+    input_text: InputText
     session_id: Optional[str] = None
-    language: str = "en"
-
-    @field_validator('input_text')
-    @classmethod
-    def validate_input_text(cls, v):
-        v = v.strip()
-        if not v:
-            raise ValueError('Input text cannot be empty')
-        if len(v) > 500:
-            raise ValueError('Input text too long (max 500 characters)')
-        return v
-
-    @field_validator('language')
-    @classmethod
-    def validate_language(cls, v):
-        if v not in SUPPORTED_LANGUAGES:
-            raise ValueError(f'Language must be one of: {SUPPORTED_LANGUAGES}')
-        return v
+    language: Literal["en", "mr"] = "en"
 
 class RatingRequest(BaseModel):
-    rating: int
+    rating: Annotated[int, Field(ge=1, le=5)]
     session_id: Optional[str] = None
     language: str = "en"
     ticket_id: Optional[str] = None
     feedback_text: Optional[str] = None
 
-    @field_validator('rating')
-    @classmethod
-    def validate_rating(cls, v):
-        if v not in [1, 2, 3, 4, 5]:
-            raise ValueError('Rating must be between 1 and 5')
-        return v
-
 class TicketStatusRequest(BaseModel):
-    ticket_id: str
+    ticket_id: NonEmptyStr
     language: str = "en"
 
-    @field_validator('ticket_id')
-    @classmethod
-    def validate_ticket_id(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Ticket ID cannot be empty')
-        return v.strip()
-
 class UserSearchRequest(BaseModel):
-    user_identifier: str
+    user_identifier: NonEmptyStr
     language: str = "en"
 
-    @field_validator('user_identifier')
-    @classmethod
-    def validate_user_identifier(cls, v):
-        if not v or not v.strip():
-            raise ValueError('User identifier cannot be empty')
-        return v.strip()
-
 # === LANGUAGE RESOURCES ===
 RATING_LABELS = {
     "en": {1: "Poor", 2: "Fair", 3: "Good", 4: "Very Good", 5: "Excellent"},
@@ -195,165 +252,375 @@ MAHA_AASTHA_KNOWLEDGE_BASE = {
     }
 }
 
+# === PRECOMPUTED RESPONSES ===
+# The knowledge base is immutable at runtime, so the canned replies built from
+# it are formatted once at import; the getter functions below just return the
+# prebuilt string instead of re-running a dozen lookups and concatenations per
+# chat turn.
+_KB_EN = MAHA_AASTHA_KNOWLEDGE_BASE["en"]
+_KB_MR = MAHA_AASTHA_KNOWLEDGE_BASE["mr"]
+
+_INITIAL_RESPONSE = {
+    "en": f"""{_KB_EN['welcome_message']}
+Question 1: {_KB_EN['initial_question']}
+Answer 1: "{_KB_EN['options']['yes']}"
+Answer 2: "{_KB_EN['options']['no']}"
+Question 2: {_KB_EN['status_check_question']}
+Answer: Type "Check Status" or enter your Ticket ID
+Example: TKT-12345678""",
+    "mr": f"""{_KB_MR['welcome_message']}
+प्रश्न क्र. १: {_KB_MR['initial_question']}
+उत्तर १ - "{_KB_MR['options']['yes']}"
+उत्तर २ - "{_KB_MR['options']['no']}"
+प्रश्न क्र. २: {_KB_MR['status_check_question']}
+उत्तर - "स्थिती तपासा" किंवा आपला तिकीट क्रमांक टाइप करा
+उदाहरण: TKT-12345678""",
+}
+
+_FEEDBACK_QUESTION = {
+    "en": f"""Question 2.2: {_KB_EN['feedback_question']}
+Answer 1: "{_KB_EN['options']['yes']}"
+Answer 2: "{_KB_EN['options']['no']}\"""",
+    "mr": f"""प्रश्न क्र. २.२: {_KB_MR['feedback_question']}
+उत्तर १ - "{_KB_MR['options']['yes']}"
+उत्तर २ - "{_KB_MR['options']['no']}\"""",
+}
+
+_RATING_REQUEST = {
+    "en": f"""{_KB_EN['rating_question']}
+{_KB_EN['rating_request']}
+1 - {RATING_LABELS['en'][1]}
+2 - {RATING_LABELS['en'][2]}
+3 - {RATING_LABELS['en'][3]}
+4 - {RATING_LABELS['en'][4]}
+5 - {RATING_LABELS['en'][5]}""",
+    "mr": f"""{_KB_MR['rating_question']}
+{_KB_MR['rating_request']}
+१ - {RATING_LABELS['mr'][1]}
+२ - {RATING_LABELS['mr'][2]}
+३ - {RATING_LABELS['mr'][3]}
+४ - {RATING_LABELS['mr'][4]}
+५ - {RATING_LABELS['mr'][5]}""",
+}
+
+_GREETING_REPLIES = {
+    "en": {
+        "good_morning": f"Good Morning! {_KB_EN['welcome_message']}",
+        "good_afternoon": f"Good Afternoon! {_KB_EN['welcome_message']}",
+        "good_evening": f"Good Evening! {_KB_EN['welcome_message']}",
+        "good_night": f"Good Night! {_KB_EN['welcome_message']}",
+        "hello": f"Hello! {_KB_EN['welcome_message']}",
+    },
+    "mr": {
+        "good_morning": f"शुभ सकाळ! {_KB_MR['welcome_message']}",
+        "good_afternoon": f"शुभ दुपार! {_KB_MR['welcome_message']}",
+        "good_evening": f"शुभ संध्याकाळ! {_KB_MR['welcome_message']}",
+        "good_night": f"शुभ रात्री! {_KB_MR['welcome_message']}",
+        "hello": _KB_MR["welcome_message"],
+    },
+}
+
+# === ERROR MESSAGES ===
+# Bilingual error dicts hoisted to module scope so the endpoints don't
+# rebuild the same literals on every failing request. The mobile-number
+# variant is a .format() template because it embeds the searched id.
+_ERR_EMPTY_QUERY = {
+    'en': "Please provide a valid query.",
+    'mr': "कृपया एक वैध प्रश्न प्रदान करा."
+}
+_ERR_RATE_LIMITED = {
+    'en': "You're sending messages too quickly. Please wait a moment and try again.",
+    'mr': "आपण खूप वेगाने संदेश पाठवत आहात. कृपया थोडा वेळ थांबा आणि पुन्हा प्रयत्न करा."
+}
+_ERR_QUERY_FAILED = {
+    'en': "An error occurred while processing your query. Please try again later.",
+    'mr': "तुमचा प्रश्न प्रक्रिया करतान त्रुटी आली. कृपया नंतर पुन्हा प्रयत्न करा."
+}
+_ERR_NO_TICKET_FOR_MOBILE = {
+    'en': "Sorry, no ticket found for mobile number {id}. Please check your registered mobile number and try again.",
+    'mr': "माफ करा, {id} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही. कृपया आपला नोंदणीकृत मोबाइल नंबर तपासा आणि पुन्हा प्रयत्न करा."
+}
+_ERR_NO_TICKET_FOR_ID = {
+    'en': "Sorry, no ticket found with the provided ID. Please check your Ticket ID and try again.",
+    'mr': "माफ करा, दिलेल्या क्रमांकाशी कोणतीही तिकीट आढळली नाही. कृपया आपला तिकीट क्रमांक तपासा आणि पुन्हा प्रयत्न करा."
+}
+_ERR_TICKET_STATUS_FAILED = {
+    'en': "An error occurred while fetching the ticket status. Please try again later.",
+    'mr': "तिकीट स्थिती मिळवताना त्रुटी आली. कृपया नंतर पुन्हा प्रयत्न करा."
+}
+_ERR_NO_USER_TICKETS = {
+    'en': "No tickets found for the provided user information.",
+    'mr': "दिलेल्या वापरकर्ता माहितीसाठी कोणत्याही तिकीटी आढळल्या नाहीत."
+}
+_ERR_RATING_SAVE_FAILED = {
+    'en': "Failed to save your rating. Please try again.",
+    'mr': "आपले रेटिंग जतन करण्यात अयशस्वी. कृपया पुन्हा प्रयत्न करा."
+}
+_ERR_RATING_INVALID = {
+    'en': "Invalid rating data. Rating must be between 1 and 5.",
+    'mr': "अवैध रेटिंग डेटा. रेटिंग 1 आणि 5 दरम्यान असावे."
+}
+_ERR_RATING_FAILED = {
+    'en': "An error occurred while processing your rating.",
+    'mr': "आपले रेटिंग प्रक्रिया करताना त्रुटी आली."
+}
+
+# === PRECOMPILED PATTERNS ===
+# Compiled once at import so the detect_* helpers run straight C-level
+# matches instead of re-hashing pattern strings on every chat message.
+# str.translate deletion tables: for plain character stripping a C-level
+# table lookup per char beats running the regex engine. The keep-only tables
+# map kept characters to themselves and report None (delete) for any other
+# codepoint without storing it — defaultdict would memoize every distinct
+# character of user input into the module-level table forever.
+_GREETING_STRIP_TABLE = dict.fromkeys(map(ord, "!.,🙂🙏✨⭐️"))
+
+class _KeepOnlyTable(dict):
+    def __missing__(self, codepoint):
+        return None
+
+def _keep_only_table(keep: str) -> dict:
+    return _KeepOnlyTable((ord(ch), ch) for ch in keep)
+
+_DIGITS_KEEP_TABLE = _keep_only_table('0123456789')
+_GREETING_RE = re.compile(
+    r"(?P<good_morning>\bgood\s*morning\b|\bशुभ\s*सकाळ\b)"
+    r"|(?P<good_afternoon>\bgood\s*afternoon\b|\bशुभ\s*दुपार\b)"
+    r"|(?P<good_evening>\bgood\s*evening\b|\bशुभ\s*संध्याकाळ\b)"
+    r"|(?P<good_night>\bgood\s*night\b|\bशुभ\s*रात्री\b)"
+    r"|(?P<hello>\bhello\b|\bhey+\b|\bhii+\b|\bhi\b|\bनमस्ते\b|\bनमस्कार\b|\bहॅलो\b|\bहेलो\b|\bहाय\b)"
+)
+
+_TICKET_ID_RE = re.compile(
+    r'\b(TKT-[a-zA-Z0-9]+|TKT[0-9a-zA-Z]+|[0-9]{6,})\b', re.IGNORECASE
+)
+
+_TICKET_ID_VALID_RE = re.compile(
+    r'^(?:TKT-[a-zA-Z0-9]{6,}|TKT[0-9a-zA-Z]{6,}|[0-9]{6,})$', re.IGNORECASE
+)
+
+# Single pass for detect_ticket_id_or_mobile: detection already implies a
+# valid format, so one alternation replaces the detect-then-validate regex
+# pairs. Mobile numbers win over bare digit runs for 10-digit [6-9] numbers.
+_ID_RE = re.compile(
+    r"(?P<ticket>\bTKT-?[A-Za-z0-9]{6,}\b)"
+    r"|(?P<mobile>(?:\+91[\s-]?|0)?[6-9]\d{9}\b)"
+    r"|(?P<ticket_digits>\b\d{6,}\b)",
+    re.IGNORECASE,
+)
+
+_EN_STATUS_RE = re.compile('|'.join(re.escape(p) for p in (
+    "would you like to check the status of your ticket",
+    "check status",
+)))
+_MR_STATUS_RE = re.compile('|'.join(re.escape(p) for p in (
+    "आपण महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदवलेल्या तिकीटची स्थिती तपासू इच्छिता का",
+    "तिकीटची स्थिती तपासू इच्छिता का",
+    "स्थिती तपासू इच्छिता का",
+    "तिकीटची स्थिती",
+    "स्थिती तपासा",
+)))
+
+# Intent keyword checks on the lowered input: one compiled alternation pass
+# instead of a substring scan per keyword.
+_FEEDBACK_RE = re.compile(r'feedback|अभिप्राय')
+_REGISTER_RE = re.compile(r'register|ticket|complaint|तिकीट|नोंदवू|शिकायत')
+
+# Single alternation per answer type: one scanner pass instead of looping
+# six separate patterns
+_YESNO_RE = re.compile(
+    r'(?P<yes>\b(?:yes|y|yeah|yep|होय|हो)\b)|(?P<no>\b(?:no|n|nope|नाही|ना)\b)'
+)
+
+_ADJECTIVES = ("sharp", "sleepy", "fluffy", "dazzling", "crazy", "bold", "happy", "silly")
+_ANIMALS = ("lion", "swan", "tiger", "elephant", "zebra", "giraffe", "panda", "koala")
+
 def generate_session_id() -> str:
     """Generate a unique session ID"""
-    import random
-    adjectives = ["sharp", "sleepy", "fluffy", "dazzling", "crazy", "bold", "happy", "silly"]
-    animals = ["lion", "swan", "tiger", "elephant", "zebra", "giraffe", "panda", "koala"]
-    return f"{random.choice(adjectives)}_{random.choice(animals)}_{os.urandom(2).hex()}_{int(time.time())}"
+    # secrets, not random: session IDs gate session state and chat history,
+    # so the random parts must come from the CSPRNG.
+    return f"{secrets.choice(_ADJECTIVES)}_{secrets.choice(_ANIMALS)}_{secrets.randbits(16):04x}_{int(time.time())}"
+
+# One-slot cache for formatted wall-clock strings. strftime is an expensive C
+# call (locale handling, tm buffer), so format at most once per second and let
+# every event within that second reuse the strings.
+_LAST_TS = [0, "", ""]
+
+def _now_strs() -> tuple[str, str]:
+    """Return ("HH:MM:SS", "YYYY-MM-DD HH:MM:SS"), cached per integer second."""
+    s = int(time.time())
+    if s != _LAST_TS[0]:
+        t = time.localtime(s)
+        _LAST_TS[:] = [s, time.strftime("%H:%M:%S", t), time.strftime("%Y-%m-%d %H:%M:%S", t)]
+    return _LAST_TS[1], _LAST_TS[2]
+
+_LAST_ISO = [0, ""]
+
+def _now_iso() -> str:
+    """ISO-8601 wall-clock string, cached per integer second like _now_strs."""
+    s = int(time.time())
+    if s != _LAST_ISO[0]:
+        _LAST_ISO[:] = [s, datetime.now().isoformat()]
+    return _LAST_ISO[1]
 
 def add_to_chat_history(session_id: str, user_msg: str, bot_msg: str, language: str = "en"):
     """Add message to chat history with language support."""
     try:
         if session_id not in CHAT_HISTORY:
-            CHAT_HISTORY[session_id] = []
-        CHAT_HISTORY[session_id].insert(0, {
+            CHAT_HISTORY[session_id] = deque(maxlen=50)
+        CHAT_HISTORY[session_id].appendleft({
             "user": user_msg,
             "assistant": bot_msg,
             "language": language,
-            "timestamp": time.strftime("%H:%M:%S"),
+            "timestamp": _now_strs()[0],
             "session_id": session_id,
             "created_at": time.time()
         })
-        CHAT_HISTORY[session_id] = CHAT_HISTORY[session_id][:50]
     except Exception as e:
         logger.error(f"Failed to add to chat history: {e}")
 
-def save_rating_data(rating: int, session_id: str, language: str, ticket_id: str = None, feedback_text: str = None) -> bool:
-    """Save rating data for CSV export with proper UTF-8 handling."""
+# Ratings are written to CSV by a background thread: the request path only
+# builds the entry and enqueues it, and the flusher drains up to 100 entries
+# per batch (or whatever arrives within 500ms) into a single append.
+_RATINGS_QUEUE = queue.Queue()
+_RATINGS_BATCH_SIZE = 100
+_RATINGS_FLUSH_WAIT = 0.5
+
+def _resolve_ratings_csv_path(timestamp_str: str) -> str:
+    """Resolve the ratings CSV path for the given YYYYMMDD date string."""
+    ratings_dir = os.path.join(os.path.dirname(__file__), 'ratings_data')
     try:
-        ratings_dir = os.path.join(os.path.dirname(__file__), 'ratings_data')
+        os.makedirs(ratings_dir, mode=0o755, exist_ok=True)
+    except PermissionError:
+        ratings_dir = os.path.dirname(__file__)
+        logger.warning("Could not create ratings_data directory, using current directory")
+    return os.path.join(ratings_dir, f'ratings_log_{timestamp_str}.csv')
+
+# The flusher owns a single file handle per day and a plain csv.writer fed
+# fixed-order tuples, so a batch costs one writerows call instead of a fresh
+# open/DictWriter per rating. Only the flusher thread touches these globals.
+_RATINGS_FIELDS = ("timestamp", "session_id", "rating", "Feedback", "language", "ticket_id")
+_ratings_fp = None
+_ratings_writer = None
+_ratings_fp_date = ""
+
+def _ratings_csv_writer(timestamp_str: str):
+    """Return the csv.writer for the given date, (re)opening the handle on rollover."""
+    global _ratings_fp, _ratings_writer, _ratings_fp_date
+    if _ratings_fp is None or _ratings_fp_date != timestamp_str:
+        if _ratings_fp is not None:
+            try:
+                _ratings_fp.close()
+            except OSError:
+                pass
+        csv_path = _resolve_ratings_csv_path(timestamp_str)
         try:
-            os.makedirs(ratings_dir, mode=0o755, exist_ok=True)
-        except PermissionError:
-            ratings_dir = os.path.dirname(__file__)
-            logger.warning("Could not create ratings_data directory, using current directory")
+            need_header = os.stat(csv_path).st_size == 0
+        except FileNotFoundError:
+            need_header = True
+        _ratings_fp = open(csv_path, mode='a', newline='', encoding='utf-8-sig')
+        _ratings_writer = csv.writer(_ratings_fp)
+        _ratings_fp_date = timestamp_str
+        if need_header:
+            _ratings_writer.writerow(_RATINGS_FIELDS)
+    return _ratings_writer
+
+def _write_rating_rows(entries: list) -> None:
+    """Append a batch of rating entries to the day's CSV with proper UTF-8 handling."""
+    global _ratings_fp, _ratings_writer
+    timestamp_str = entries[0]["timestamp"][:10].replace('-', '')
+    rows = [tuple(entry[field] for field in _RATINGS_FIELDS) for entry in entries]
+    try:
+        writer = _ratings_csv_writer(timestamp_str)
+        writer.writerows(rows)
+        _ratings_fp.flush()
+    except (PermissionError, OSError) as file_error:
+        _ratings_fp = None
+        _ratings_writer = None
+        import tempfile
+        temp_dir = tempfile.gettempdir()
+        alternative_path = os.path.join(temp_dir, f'maha_aastha_ratings_{timestamp_str}.csv')
+        try:
+            alt_need_header = os.stat(alternative_path).st_size == 0
+        except FileNotFoundError:
+            alt_need_header = True
+        with open(alternative_path, mode='a', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            if alt_need_header:
+                writer.writerow(_RATINGS_FIELDS)
+            writer.writerows(rows)
+        logger.info(f"Ratings saved to alternative location: {alternative_path}")
+
+def _ratings_flush_loop() -> None:
+    """Drain queued rating entries in batches and append them to CSV."""
+    while True:
+        entries = [_RATINGS_QUEUE.get()]
+        deadline = time.monotonic() + _RATINGS_FLUSH_WAIT
+        while len(entries) < _RATINGS_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entries.append(_RATINGS_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _write_rating_rows(entries)
+        except Exception as e:
+            logger.error(f"Error flushing ratings to CSV: {e}")
 
-        timestamp_str = datetime.now().strftime("%Y%m%d")
-        csv_filename = f'ratings_log_{timestamp_str}.csv'
-        csv_path = os.path.join(ratings_dir, csv_filename)
+_ratings_flusher = threading.Thread(target=_ratings_flush_loop, name="ratings-flusher", daemon=True)
+_ratings_flusher.start()
 
+def save_rating_data(rating: int, session_id: str, language: str, ticket_id: str = None, feedback_text: str = None) -> bool:
+    """Record a rating in memory and queue it for CSV export off the request path."""
+    try:
         rating_entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": _now_strs()[1],
             "session_id": session_id,
             "rating": rating,
             "Feedback": RATING_LABELS[language][rating],
             "language": language,
             "ticket_id": ticket_id or "N/A"
         }
-
-        file_exists = os.path.exists(csv_path)
-        try:
-            with open(csv_path, mode='a', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=rating_entry.keys())
-                if not file_exists or os.path.getsize(csv_path) == 0:
-                    writer.writeheader()
-                writer.writerow(rating_entry)
-        except (PermissionError, OSError) as file_error:
-            import tempfile
-            temp_dir = tempfile.gettempdir()
-            alternative_path = os.path.join(temp_dir, f'maha_aastha_ratings_{timestamp_str}.csv')
-            alt_file_exists = os.path.exists(alternative_path)
-            with open(alternative_path, mode='a', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=rating_entry.keys())
-                if not alt_file_exists or os.path.getsize(alternative_path) == 0:
-                    writer.writeheader()
-                writer.writerow(rating_entry)
-            logger.info(f"Rating saved to alternative location: {alternative_path}")
-
         RATINGS_DATA.append(rating_entry)
+        RATING_STATS["count"] += 1
+        RATING_STATS["sum"] += rating
+        RATING_STATS["ratings"][rating] += 1
+        RATING_STATS["languages"][language] += 1
+        _RATINGS_QUEUE.put_nowait(rating_entry)
         logger.info(f"Rating saved successfully: {rating}/5 ({RATING_LABELS[language][rating]}) for session {session_id}")
         return True
     except Exception as e:
         logger.error(f"Error saving rating data: {e}")
-        try:
-            rating_entry = {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "session_id": session_id,
-                "rating": rating,
-                "Feedback": RATING_LABELS[language][rating],
-                "language": language,
-                "ticket_id": ticket_id or "N/A"
-            }
-            RATINGS_DATA.append(rating_entry)
-            logger.info(f"Rating saved to memory only: {rating}/5 for session {session_id}")
-            return True
-        except Exception as memory_error:
-            logger.error(f"Failed to save rating even to memory: {memory_error}")
-            return False
+        return False
 
 def detect_greeting(text: str) -> tuple[bool, str]:
     """Detect greeting intent and return a normalized key."""
     try:
         t = text.strip().lower()
-        t = re.sub(r"[!.,🙂🙏✨⭐️]+", "", t)
-        patterns = [
-            (r"\bgood\s*morning\b|\bशुभ\s*सकाळ\b", "good_morning"),
-            (r"\bgood\s*afternoon\b|\bशुभ\s*दुपार\b", "good_afternoon"),
-            (r"\bgood\s*evening\b|\bशुभ\s*संध्याकाळ\b", "good_evening"),
-            (r"\bhello\b|\bhey+\b|\bhii+\b|\bhi\b|\bनमस्ते\b|\bनमस्कार\b|\bहॅलो\b|\bहेलो\b|\bहाय\b", "hello"),
-            (r"\bgood\s*night\b|\bशुभ\s*रात्री\b", "good_night"),
-        ]
-        for regex, key in patterns:
-            if re.search(regex, t):
-                return True, key
+        t = t.translate(_GREETING_STRIP_TABLE)
+        match = _GREETING_RE.search(t)
+        if match:
+            return True, match.lastgroup
         return False, ""
     except Exception:
         return False, ""
 
 def detect_ticket_id(text: str) -> Optional[str]:
     """Detect potential ticket ID in text."""
-    patterns = [
-        r'\b(TKT-[a-zA-Z0-9]+)\b',
-        r'\b(TKT[0-9a-zA-Z]+)\b',
-        r'\b([0-9]{6,})\b'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
+    match = _TICKET_ID_RE.search(text)
+    if match:
+        return match.group(1)
     return None
 
 def validate_ticket_id_format(ticket_id: str) -> bool:
     """Validate if the ticket ID matches expected Maha Aastha format."""
-    valid_patterns = [
-        r'^TKT-[a-zA-Z0-9]{6,}$',
-        r'^TKT[0-9a-zA-Z]{6,}$',
-        r'^[0-9]{6,}$'
-    ]
-    for pattern in valid_patterns:
-        if re.match(pattern, ticket_id.strip(), re.IGNORECASE):
-            return True
-    return False
-
-def detect_mobile_number(text: str) -> Optional[str]:
-    """Detect Indian mobile number patterns in text."""
-    clean_text = re.sub(r'[^\d+\s]', '', text)
-    
-    patterns = [
-        r'\b(\+91[\s-]?)?([6-9]\d{9})\b',
-        r'\b([6-9]\d{9})\b',
-        r'\b(0\d{10})\b'
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, clean_text)
-        for match in matches:
-            if match.group(1) and match.group(2):
-                mobile = match.group(2)
-            elif match.group(1):
-                mobile = match.group(1)
-            else:
-                mobile = match.group(0)[1:]
-            
-            if len(mobile) == 10 and mobile[0] in '6789':
-                return mobile
-    
-    return None
+    return _TICKET_ID_VALID_RE.match(ticket_id.strip()) is not None
 
 def validate_mobile_number_format(mobile_number: str) -> bool:
     """Validate if the mobile number matches Indian format."""
-    digits_only = re.sub(r'\D', '', mobile_number)
+    digits_only = mobile_number.translate(_DIGITS_KEEP_TABLE)
     
     if len(digits_only) == 10 and digits_only[0] in '6789':
         return True
@@ -371,72 +638,54 @@ def detect_ticket_id_or_mobile(text: str) -> tuple[Optional[str], str]:
     Detect either ticket ID or mobile number and return the type
     Returns: (identifier, type) where type is 'ticket_id', 'mobile_number', or None
     """
-    ticket_id = detect_ticket_id(text)
-    if ticket_id and validate_ticket_id_format(ticket_id):
-        return ticket_id, 'ticket_id'
-    
-    mobile_number = detect_mobile_number(text)
-    if mobile_number and validate_mobile_number_format(mobile_number):
-        return mobile_number, 'mobile_number'
-    
-    return None, None
+    match = _ID_RE.search(text)
+    if not match:
+        return None, None
+    if match.lastgroup == 'mobile':
+        digits = match.group('mobile').translate(_DIGITS_KEEP_TABLE)
+        return digits[-10:], 'mobile_number'
+    return match.group(match.lastgroup), 'ticket_id'
 
 def detect_exact_status_question(text: str, language: str) -> bool:
-    """Detect the exact status check question."""
-    text_lower = text.lower().strip()
+    """Detect the exact status check question. Expects lowercased text."""
     if language == "en":
-        return "would you like to check the status of your ticket" in text_lower or "check status" in text_lower
-    else:
-        status_patterns = [
-            "आपण महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदवलेल्या तिकीटची स्थिती तपासू इच्छिता का",
-            "तिकीटची स्थिती तपासू इच्छिता का",
-            "स्थिती तपासू इच्छिता का",
-            "तिकीटची स्थिती",
-            "स्थिती तपासा"
-        ]
-        return any(pattern in text for pattern in status_patterns)
+        return _EN_STATUS_RE.search(text) is not None
+    return _MR_STATUS_RE.search(text) is not None
 
 def greeting_reply(language: str, key: str) -> str:
     """Return a specific greeting reply per detected key and language."""
-    KB = MAHA_AASTHA_KNOWLEDGE_BASE[language]
-    replies = {
-        "en": {
-            "good_morning": f"Good Morning! {KB['welcome_message']}",
-            "good_afternoon": f"Good Afternoon! {KB['welcome_message']}",
-            "good_evening": f"Good Evening! {KB['welcome_message']}",
-            "good_night": f"Good Night! {KB['welcome_message']}",
-            "hello": f"Hello! {KB['welcome_message']}",
-        },
-        "mr": {
-            "good_morning": f"शुभ सकाळ! {KB['welcome_message']}",
-            "good_afternoon": f"शुभ दुपार! {KB['welcome_message']}",
-            "good_evening": f"शुभ संध्याकाळ! {KB['welcome_message']}",
-            "good_night": f"शुभ रात्री! {KB['welcome_message']}",
-            "hello": KB["welcome_message"],
-        }
-    }
-    return replies.get(language, {}).get(key, replies["en"]["hello"])
+    replies = _GREETING_REPLIES.get(language, _GREETING_REPLIES["en"])
+    return replies.get(key, _GREETING_REPLIES["en"]["hello"])
 
 def detect_yes_no_response(text: str, language: str) -> str:
-    """Detect yes/no responses in both languages."""
-    text = text.strip().lower()
-    yes_patterns_en = [r'\byes\b', r'\by\b', r'\byeah\b', r'\byep\b']
-    no_patterns_en = [r'\bno\b', r'\bn\b', r'\bnope\b']
-    yes_patterns_mr = [r'\bहोय\b', r'\bहो\b']
-    no_patterns_mr = [r'\bनाही\b', r'\bना\b']
-    for pattern in yes_patterns_en + yes_patterns_mr:
-        if re.search(pattern, text):
-            return "yes"
-    for pattern in no_patterns_en + no_patterns_mr:
-        if re.search(pattern, text):
-            return "no"
+    """Detect yes/no responses in both languages. Expects lowercased text."""
+    match = _YESNO_RE.search(text)
+    if match:
+        return match.lastgroup
     return "unknown"
 
+# Rendered status messages, memoized per ticket and language. A ticket's
+# formatted text only changes when its status or updated_at does, so repeat
+# lookups for the same ticket skip the date formatting and string assembly.
+_STATUS_MSG_CACHE = OrderedDict()
+_STATUS_MSG_CACHE_SIZE = 128
+
 def format_simple_ticket_status(ticket_data: dict, language: str) -> str:
     """Format ticket status data into a readable message."""
     if not ticket_data:
         return "Ticket not found" if language == "en" else "तिकीट आढळले नाही"
 
+    cache_key = (
+        ticket_data.get('ticket'),
+        language,
+        ticket_data.get('status'),
+        ticket_data.get('updated_at'),
+    )
+    cached = _STATUS_MSG_CACHE.get(cache_key)
+    if cached is not None:
+        _STATUS_MSG_CACHE.move_to_end(cache_key)
+        return cached
+
     created_date = (
         ticket_data["created_at"].strftime("%d-%b-%Y")
         if ticket_data.get("created_at")
@@ -479,129 +728,82 @@ Category: {ticket_data.get('issue_category', 'N/A')}"""
         if updated_date:
             status_message += f"\nशेवटचा अद्यतन: {updated_date}"
 
+    _STATUS_MSG_CACHE[cache_key] = status_message
+    if len(_STATUS_MSG_CACHE) > _STATUS_MSG_CACHE_SIZE:
+        _STATUS_MSG_CACHE.popitem(last=False)
     return status_message
 
 def get_initial_response_with_status_option(language: str) -> str:
     """Get enhanced initial response with status check option."""
-    kb = MAHA_AASTHA_KNOWLEDGE_BASE[language]
-    if language == "mr":
-        return f"""{kb['welcome_message']}
-प्रश्न क्र. १: {kb['initial_question']}
-उत्तर १ - "{kb['options']['yes']}"
-उत्तर २ - "{kb['options']['no']}"
-प्रश्न क्र. २: {kb['status_check_question']}
-उत्तर - "स्थिती तपासा" किंवा आपला तिकीट क्रमांक टाइप करा
-उदाहरण: TKT-12345678"""
-    else:
-        return f"""{kb['welcome_message']}
-Question 1: {kb['initial_question']}
-Answer 1: "{kb['options']['yes']}"
-Answer 2: "{kb['options']['no']}"
-Question 2: {kb['status_check_question']}
-Answer: Type "Check Status" or enter your Ticket ID
-Example: TKT-12345678"""
+    return _INITIAL_RESPONSE[language]
 
 def get_feedback_question(language: str) -> str:
     """Get the feedback question."""
-    kb = MAHA_AASTHA_KNOWLEDGE_BASE[language]
-    if language == "mr":
-        return f"""प्रश्न क्र. २.२: {kb['feedback_question']}
-उत्तर १ - "{kb['options']['yes']}"
-उत्तर २ - "{kb['options']['no']}\""""
-    else:
-        return f"""Question 2.2: {kb['feedback_question']}
-Answer 1: "{kb['options']['yes']}"
-Answer 2: "{kb['options']['no']}\""""
+    return _FEEDBACK_QUESTION[language]
 
 def get_rating_request(language: str) -> str:
     """Get the rating request message."""
-    kb = MAHA_AASTHA_KNOWLEDGE_BASE[language]
-    if language == "mr":
-        return f"""{kb['rating_question']}
-{kb['rating_request']}
-१ - {RATING_LABELS['mr'][1]}
-२ - {RATING_LABELS['mr'][2]}
-३ - {RATING_LABELS['mr'][3]}
-४ - {RATING_LABELS['mr'][4]}
-५ - {RATING_LABELS['mr'][5]}"""
-    else:
-        return f"""{kb['rating_question']}
-{kb['rating_request']}
-1 - {RATING_LABELS['en'][1]}
-2 - {RATING_LABELS['en'][2]}
-3 - {RATING_LABELS['en'][3]}
-4 - {RATING_LABELS['en'][4]}
-5 - {RATING_LABELS['en'][5]}"""
+    return _RATING_REQUEST[language]
+
+async def _ticket_status_reply(identifier: str, identifier_type: str, language: str, session_state: dict = None) -> str:
+    """Shared ticket lookup: fetch status for an ID or mobile and format the reply.
+
+    session_state is None for the top-of-turn detection path (before the
+    session is resolved), which also selects the longer not-found message.
+    """
+    try:
+        ticket_data = await get_ticket_status(identifier)
+    except Exception as e:
+        logger.error(f"Error fetching ticket status: {e}")
+        return MAHA_AASTHA_KNOWLEDGE_BASE[language]["database_error"]
+
+    if ticket_data:
+        if session_state is not None:
+            session_state["stage"] = "status_shown"
+        status_response = format_simple_ticket_status(ticket_data, language)
+        if identifier_type == 'mobile_number':
+            if language == "mr":
+                status_response += f"\n\n📱 मोबाइल नंबरद्वारे शोधले गेले: {identifier}"
+            else:
+                status_response += f"\n\n📱 Found using mobile number: {identifier}"
+        status_response += f"\n\n🔗 {MAHA_AASTHA_KNOWLEDGE_BASE[language]['track_ticket_help']}"
+        return status_response
+
+    if identifier_type == 'mobile_number':
+        if session_state is None:
+            if language == "mr":
+                return f"माफ करा, {identifier} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही. कृपया आपला तिकीट क्रमांक किंवा नोंदणीकृत मोबाइल नंबर तपासा."
+            return f"Sorry, no ticket found for mobile number {identifier}. Please check your ticket ID or registered mobile number."
+        if language == "mr":
+            return f"माफ करा, {identifier} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही."
+        return f"Sorry, no ticket found for mobile number {identifier}."
+    return MAHA_AASTHA_KNOWLEDGE_BASE[language]["ticket_not_found"]
 
 async def process_maha_aastha_query(input_text: str, session_id: str, language: str) -> str:
     """Process user queries for the Maha Aastha system."""
-    logger.info(f"Processing query: {input_text} for session: {session_id} in language: {language}")
+    logger.info("Processing query: %s for session: %s in language: %s", input_text, session_id, language)
+
+    # Normalize once: every keyword check and detect helper below works on
+    # this lowercased form instead of re-allocating its own copy.
+    text_lower = input_text.lower().strip()
 
     identifier, identifier_type = detect_ticket_id_or_mobile(input_text)
     
     if identifier and identifier_type:
-        logger.info(f"Detected {identifier_type}: {identifier}")
-        try:
-            ticket_data = await db_manager.get_ticket_status(identifier)
-            if ticket_data:
-                logger.info(f"Found ticket data for {identifier_type}: {ticket_data}")
-                status_response = format_simple_ticket_status(ticket_data, language)
-                
-                if identifier_type == 'mobile_number':
-                    if language == "mr":
-                        status_response += f"\n\n📱 मोबाइल नंबरद्वारे शोधले गेले: {identifier}"
-                    else:
-                        status_response += f"\n\n📱 Found using mobile number: {identifier}"
-                
-                status_response += f"\n\n🔗 {MAHA_AASTHA_KNOWLEDGE_BASE[language]['track_ticket_help']}"
-                return status_response
-            else:
-                if identifier_type == 'mobile_number':
-                    if language == "mr":
-                        return f"माफ करा, {identifier} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही. कृपया आपला तिकीट क्रमांक किंवा नोंदणीकृत मोबाइल नंबर तपासा."
-                    else:
-                        return f"Sorry, no ticket found for mobile number {identifier}. Please check your ticket ID or registered mobile number."
-                else:
-                    return MAHA_AASTHA_KNOWLEDGE_BASE[language]["ticket_not_found"]
-        except Exception as e:
-            logger.error(f"Error fetching ticket status: {e}")
-            return MAHA_AASTHA_KNOWLEDGE_BASE[language]["database_error"]
+        logger.info("Detected %s: %s", identifier_type, identifier)
+        return await _ticket_status_reply(identifier, identifier_type, language)
 
     if session_id not in USER_SESSION_STATE:
         USER_SESSION_STATE[session_id] = {"stage": "initial", "language": language}
     session_state = USER_SESSION_STATE[session_id]
 
-    response_type = detect_yes_no_response(input_text, language)
+    response_type = detect_yes_no_response(text_lower, language)
 
-    if detect_exact_status_question(input_text, language):
-        identifier, identifier_type = detect_ticket_id_or_mobile(input_text)
-        
-        if identifier and (validate_ticket_id_format(identifier) or validate_mobile_number_format(identifier)):
-            try:
-                ticket_data = await get_ticket_status(identifier)
-                if ticket_data:
-                    session_state["stage"] = "status_shown"
-                    status_response = format_simple_ticket_status(ticket_data, language)
-                    
-                    if identifier_type == 'mobile_number':
-                        if language == "mr":
-                            status_response += f"\n\n📱 मोबाइल नंबरद्वारे शोधले गेले: {identifier}"
-                        else:
-                            status_response += f"\n\n📱 Found using mobile number: {identifier}"
-                    
-                    status_response += f"\n\n🔗 {MAHA_AASTHA_KNOWLEDGE_BASE[language]['track_ticket_help']}"
-                    return status_response
-                else:
-                    if identifier_type == 'mobile_number':
-                        if language == "mr":
-                            return f"माफ करा, {identifier} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही."
-                        else:
-                            return f"Sorry, no ticket found for mobile number {identifier}."
-                    else:
-                        return MAHA_AASTHA_KNOWLEDGE_BASE[language]["ticket_not_found"]
-            except Exception as e:
-                logger.error(f"Error fetching ticket status: {e}")
-                return MAHA_AASTHA_KNOWLEDGE_BASE[language]["database_error"]
+    # identifier/identifier_type from the single detection pass above are
+    # still in scope; re-running the regex on the same text is redundant.
+    if detect_exact_status_question(text_lower, language):
+        if identifier:
+            return await _ticket_status_reply(identifier, identifier_type, language, session_state)
         else:
             session_state["stage"] = "waiting_for_ticket_id"
             if language == "mr":
@@ -612,41 +814,15 @@ async def process_maha_aastha_query(input_text: str, session_id: str, language:
 Or enter your registered mobile number (Example: 9876543210)"""
 
     if session_state.get("stage") == "waiting_for_ticket_id":
-        identifier, identifier_type = detect_ticket_id_or_mobile(input_text)
-        
-        if identifier and (validate_ticket_id_format(identifier) or validate_mobile_number_format(identifier)):
-            try:
-                ticket_data = await get_ticket_status(identifier)
-                if ticket_data:
-                    session_state["stage"] = "status_shown"
-                    status_response = format_simple_ticket_status(ticket_data, language)
-                    
-                    if identifier_type == 'mobile_number':
-                        if language == "mr":
-                            status_response += f"\n\n📱 मोबाइल नंबरद्वारे शोधले गेले: {identifier}"
-                        else:
-                            status_response += f"\n\n📱 Found using mobile number: {identifier}"
-                    
-                    status_response += f"\n\n🔗 {MAHA_AASTHA_KNOWLEDGE_BASE[language]['track_ticket_help']}"
-                    return status_response
-                else:
-                    if identifier_type == 'mobile_number':
-                        if language == "mr":
-                            return f"माफ करा, {identifier} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही."
-                        else:
-                            return f"Sorry, no ticket found for mobile number {identifier}."
-                    else:
-                        return MAHA_AASTHA_KNOWLEDGE_BASE[language]["ticket_not_found"]
-            except Exception as e:
-                logger.error(f"Error fetching ticket status: {e}")
-                return MAHA_AASTHA_KNOWLEDGE_BASE[language]["database_error"]
+        if identifier:
+            return await _ticket_status_reply(identifier, identifier_type, language, session_state)
         else:
             if language == "mr":
                 return "कृपया योग्य तिकीट क्रमांक किंवा 10-अंकी मोबाइल नंबर प्रदान करा."
             else:
                 return "Please provide a valid Ticket ID or 10-digit mobile number."
 
-    if "feedback" in input_text.lower() or "अभिप्राय" in input_text.lower():
+    if _FEEDBACK_RE.search(text_lower):
         session_state["stage"] = "feedback_question"
         return get_feedback_question(language)
 
@@ -662,10 +838,7 @@ Or enter your registered mobile number (Example: 9876543210)"""
 
     if (
         session_state["stage"] == "initial"
-        or any(
-            kw in input_text.lower()
-            for kw in ["register", "ticket", "complaint", "तिकीट", "नोंदवू", "शिकायत"]
-        )
+        or _REGISTER_RE.search(text_lower)
     ):
         if response_type == "yes":
             session_state["stage"] = "registration_info"
@@ -722,7 +895,8 @@ app = FastAPI(
     title="Maha Aastha Chatbot Backend",
     description="Grievance Redressal System Chatbot with bilingual support, PostgreSQL database integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -731,36 +905,16 @@ app.add_middleware(
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"]
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["*"],
+    max_age=86400
 )
 
-@app.middleware("http")
-async def add_cors_header(request: Request, call_next):
-    """Additional CORS handling."""
-    response = await call_next(request)
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
-
-@app.options("/{full_path:path}")
-async def preflight_handler(request: Request, full_path: str):
-    """Handle preflight OPTIONS requests."""
-    return JSONResponse(
-        status_code=200,
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "*",
-        }
-    )
-
 @app.get("/")
 async def root():
     try:
         uptime = time.time() - SYSTEM_STATUS["startup_time"]
-        db_info = await get_db_info() if SYSTEM_STATUS["database_connected"] else {"connected": False}
+        db_info = await get_cached_db_info() if SYSTEM_STATUS["database_connected"] else {"connected": False}
         return {
             "message": "Maha Aastha Chatbot Backend is running",
             "system": "Grievance Redressal System with Database Integration",
@@ -777,7 +931,7 @@ async def root():
         }
     except Exception as e:
         logger.error(f"Root endpoint error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": f"System error: {str(e)}"}
         )
@@ -791,24 +945,29 @@ async def process_query(request: QueryRequest):
     
     if not input_text:
         SYSTEM_STATUS["failed_queries"] += 1
-        error_msg = {
-            'en': "Please provide a valid query.",
-            'mr': "कृपया एक वैध प्रश्न प्रदान करा."
-        }
-        return JSONResponse(
+        error_msg = _ERR_EMPTY_QUERY
+        return ORJSONResponse(
             status_code=400,
             content={"reply": error_msg.get(language, error_msg['en'])}
         )
     
-    if language not in SUPPORTED_LANGUAGES:
+    if language not in _SUPPORTED_LANGUAGES_SET:
         SYSTEM_STATUS["failed_queries"] += 1
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"reply": f"Language '{language}' not supported. Use: {', '.join(SUPPORTED_LANGUAGES)}"}
         )
     
     session_id = request.session_id or generate_session_id()
 
+    if request.session_id and not check_rate_limit(session_id):
+        SYSTEM_STATUS["failed_queries"] += 1
+        error_msg = _ERR_RATE_LIMITED
+        return ORJSONResponse(
+            status_code=429,
+            content={"reply": error_msg.get(language, error_msg['en']), "session_id": session_id}
+        )
+
     is_greet, greet_key = detect_greeting(input_text)
     if is_greet:
         SYSTEM_STATUS["successful_queries"] += 1
@@ -839,11 +998,8 @@ async def process_query(request: QueryRequest):
         SYSTEM_STATUS["failed_queries"] += 1
         SYSTEM_STATUS["last_error"] = str(query_error)
         logger.error(f"Query processing error: {query_error}")
-        error_msg = {
-            'en': "An error occurred while processing your query. Please try again later.",
-            'mr': "तुमचा प्रश्न प्रक्रिया करतान त्रुटी आली. कृपया नंतर पुन्हा प्रयत्न करा."
-        }
-        return JSONResponse(
+        error_msg = _ERR_QUERY_FAILED
+        return ORJSONResponse(
             status_code=500,
             content={"reply": error_msg.get(language, error_msg['en'])}
         )
@@ -851,24 +1007,20 @@ async def process_query(request: QueryRequest):
 @app.post("/ticket/status/")
 async def get_ticket_status_endpoint(request: TicketStatusRequest):
     """Get ticket status by ID or mobile number"""
-    logger.info(f"Received ticket status request for ID: {request.ticket_id}, Language: {request.language}")
+    logger.info("Received ticket status request for ID: %s, Language: %s", request.ticket_id, request.language)
     try:
-        if not db_manager.pool:
-            logger.info("Initializing database connection...")
-            await db_manager.init_pool()
-
         ticket_data = await db_manager.get_ticket_status(request.ticket_id)
-        logger.info(f"Retrieved ticket data: {ticket_data}")
+        logger.info("Retrieved ticket data: %s", ticket_data)
 
         if ticket_data:
             identifier_type = "mobile_number" if validate_mobile_number_format(request.ticket_id) else "ticket_id"
             
             formatted_status = format_simple_ticket_status(ticket_data, request.language)
-            logger.info(f"Formatted status message: {formatted_status}")
+            logger.info("Formatted status message: %s", formatted_status)
             # Log ticket status lookup
             log_chat(None, f"ticket_status_lookup:{request.ticket_id}", formatted_status, request.language, endpoint='/ticket/status/')
             
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "success": True,
                     "found": True,
@@ -885,35 +1037,28 @@ async def get_ticket_status_endpoint(request: TicketStatusRequest):
             identifier_type = "mobile_number" if validate_mobile_number_format(request.ticket_id) else "ticket_id"
             
             if identifier_type == "mobile_number":
-                error_msg = {
-                    'en': f"Sorry, no ticket found for mobile number {request.ticket_id}. Please check your registered mobile number and try again.",
-                    'mr': f"माफ करा, {request.ticket_id} या मोबाइल नंबरसाठी कोणतीही तिकीट आढळली नाही. कृपया आपला नोंदणीकृत मोबाइल नंबर तपासा आणि पुन्हा प्रयत्न करा."
-                }
+                template = _ERR_NO_TICKET_FOR_MOBILE
+                message = template.get(request.language, template['en']).format(id=request.ticket_id)
             else:
-                error_msg = {
-                    'en': "Sorry, no ticket found with the provided ID. Please check your Ticket ID and try again.",
-                    'mr': "माफ करा, दिलेल्या क्रमांकाशी कोणतीही तिकीट आढळली नाही. कृपया आपला तिकीट क्रमांक तपासा आणि पुन्हा प्रयत्न करा."
-                }
-            
+                error_msg = _ERR_NO_TICKET_FOR_ID
+                message = error_msg.get(request.language, error_msg['en'])
+
             logger.warning(f"No ticket found with {identifier_type}: {request.ticket_id}")
-            log_chat(None, f"ticket_status_lookup:{request.ticket_id}", error_msg.get(request.language, error_msg['en']), request.language, endpoint='/ticket/status/')
-            return JSONResponse(
+            log_chat(None, f"ticket_status_lookup:{request.ticket_id}", message, request.language, endpoint='/ticket/status/')
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "success": False,
                     "found": False,
-                    "message": error_msg.get(request.language, error_msg['en']),
+                    "message": message,
                     "search_method": identifier_type,
                     "search_value": request.ticket_id
                 }
             )
     except Exception as e:
         logger.error(f"Error processing ticket status request: {str(e)}")
-        error_msg = {
-            'en': "An error occurred while fetching the ticket status. Please try again later.",
-            'mr': "तिकीट स्थिती मिळवताना त्रुटी आली. कृपया नंतर पुन्हा प्रयत्न करा."
-        }
-        return JSONResponse(
+        error_msg = _ERR_TICKET_STATUS_FAILED
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -935,11 +1080,8 @@ async def search_user_tickets_endpoint(request: UserSearchRequest):
                 "language": request.language
             }
         else:
-            error_msg = {
-                'en': "No tickets found for the provided user information.",
-                'mr': "दिलेल्या वापरकर्ता माहितीसाठी कोणत्याही तिकीटी आढळल्या नाहीत."
-            }
-            return JSONResponse(
+            error_msg = _ERR_NO_USER_TICKETS
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "found": False,
@@ -948,7 +1090,7 @@ async def search_user_tickets_endpoint(request: UserSearchRequest):
             )
     except Exception as e:
         logger.error(f"Error searching user tickets: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "found": False,
@@ -956,25 +1098,97 @@ async def search_user_tickets_endpoint(request: UserSearchRequest):
             }
         )
 
+@app.post("/user/search/stream/")
+async def stream_user_tickets_endpoint(request: UserSearchRequest):
+    """Stream tickets for a user as newline-delimited JSON.
+
+    Rows come off a server-side cursor and are flushed incrementally, so
+    memory stays bounded however many tickets the number has.
+    """
+    async def ticket_stream():
+        async for ticket in stream_tickets_by_phone(request.user_identifier):
+            yield json.dumps(ticket, default=str) + "\n"
+
+    return StreamingResponse(ticket_stream(), media_type="application/x-ndjson")
+
+@app.post("/tickets/import/")
+async def import_tickets_csv(file: UploadFile = File(...)):
+    """Bulk-import tickets from an uploaded CSV via the COPY protocol.
+
+    All rows are streamed to PostgreSQL in a single COPY instead of one
+    INSERT round-trip per ticket.
+    """
+    try:
+        content = (await file.read()).decode('utf-8-sig')
+        reader = csv.DictReader(io.StringIO(content))
+
+        now = datetime.now()
+        records = []
+        for row in reader:
+            records.append((
+                row.get('ticket', ''),
+                row.get('employee_id', ''),
+                row.get('employee_name', 'Unknown'),
+                row.get('mobile_number', ''),
+                row.get('official_email', ''),
+                row.get('designation', ''),
+                row.get('department', ''),
+                row.get('office_name', ''),
+                row.get('district_name') or None,
+                row.get('user_role', 'Employee'),
+                _PRIORITY_MAP.get(row.get('priority') or 'Low', 'Low'),
+                now,
+                row.get('issue_category', 'Other'),
+                row.get('issue_sub_category') or None,
+                row.get('issue_related') or None,
+                row.get('issue_section') or None,
+                row.get('issue_sub_section') or None,
+                row.get('subject', 'No subject'),
+                row.get('description', 'No description'),
+                row.get('status', 'Open'),
+                0,
+                now,
+                now
+            ))
+
+        if not records:
+            return ORJSONResponse(
+                status_code=400,
+                content={"success": False, "message": "No ticket rows found in the uploaded CSV"}
+            )
+
+        imported = await bulk_save_tickets(records)
+        return {
+            "success": imported > 0,
+            "imported": imported,
+            "total_rows": len(records)
+        }
+    except Exception as e:
+        logger.error(f"CSV ticket import error: {e}")
+        return ORJSONResponse(
+            status_code=500,
+            content={"success": False, "message": f"Failed to import tickets: {str(e)}"}
+        )
+
 @app.get("/database/stats/")
 async def get_database_stats():
     """Get database statistics."""
     try:
         if not SYSTEM_STATUS["database_connected"]:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"error": "Database not connected"}
             )
         stats = await db_manager.get_ticket_stats()
-        db_info = await get_db_info()
+        db_info = await get_cached_db_info()
         return {
             "database_info": db_info,
             "ticket_statistics": stats,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         logger.error(f"Error getting database stats: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": f"Failed to get database statistics: {str(e)}"}
         )
@@ -982,7 +1196,7 @@ async def get_database_stats():
 @app.post("/rating/")
 async def submit_rating(request: RatingRequest):
     """Submit user rating for service quality."""
-    logger.info(f"Received rating request: {request.dict()}")
+    logger.info("Received rating request: rating=%s language=%s session=%s", request.rating, request.language, request.session_id)
     try:
         session_id = request.session_id or generate_session_id()
         rating_label = RATING_LABELS[request.language][request.rating]
@@ -999,7 +1213,7 @@ async def submit_rating(request: RatingRequest):
                 'en': f"Thank you for your {request.rating}-star rating! ({rating_label})",
                 'mr': f"आपल्या {request.rating}-स्टार रेटिंगसाठी धन्यवाद! ({rating_label})"
             }
-            logger.info(f"Successfully saved rating: {request.rating} stars for session {session_id}")
+            logger.info("Successfully saved rating: %s stars for session %s", request.rating, session_id)
             add_to_chat_history(
                 session_id,
                 f"Rating: {request.rating}/5",
@@ -1008,7 +1222,7 @@ async def submit_rating(request: RatingRequest):
             )
             # Log rating submission
             log_chat(session_id, f"rating:{request.rating}", response_msg.get(request.language, response_msg['en']), request.language, endpoint='/rating/')
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "success": True,
@@ -1020,12 +1234,9 @@ async def submit_rating(request: RatingRequest):
                 }
             )
         else:
-            error_msg = {
-                'en': "Failed to save your rating. Please try again.",
-                'mr': "आपले रेटिंग जतन करण्यात अयशस्वी. कृपया पुन्हा प्रयत्न करा."
-            }
+            error_msg = _ERR_RATING_SAVE_FAILED
             logger.error(f"Failed to save rating for session {session_id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "success": False,
@@ -1034,11 +1245,8 @@ async def submit_rating(request: RatingRequest):
             )
     except ValidationError as ve:
         logger.error(f"Validation error in rating submission: {ve}")
-        error_msg = {
-            'en': "Invalid rating data. Rating must be between 1 and 5.",
-            'mr': "अवैध रेटिंग डेटा. रेटिंग 1 आणि 5 दरम्यान असावे."
-        }
-        return JSONResponse(
+        error_msg = _ERR_RATING_INVALID
+        return ORJSONResponse(
             status_code=400,
             content={
                 "success": False,
@@ -1048,11 +1256,8 @@ async def submit_rating(request: RatingRequest):
         )
     except Exception as e:
         logger.error(f"Error in rating submission: {str(e)}")
-        error_msg = {
-            'en': "An error occurred while processing your rating.",
-            'mr': "आपले रेटिंग प्रक्रिया करताना त्रुटी आली."
-        }
-        return JSONResponse(
+        error_msg = _ERR_RATING_FAILED
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -1066,32 +1271,40 @@ async def export_ratings():
     """Export ratings data as CSV with UTF-8 support."""
     try:
         if not RATINGS_DATA:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"error": "No ratings data available for export"}
             )
-        output = io.StringIO()
-        fieldnames = ["timestamp", "session_id", "rating", "feedback", "language", "ticket_id"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for rating_data in RATINGS_DATA:
-            modified_row = {
-                "timestamp": rating_data["timestamp"],
-                "session_id": rating_data["session_id"],
-                "rating": rating_data["rating"],
-                "feedback": rating_data["Feedback"],
-                "language": rating_data["language"],
-                "ticket_id": rating_data["ticket_id"]
-            }
-            writer.writerow(modified_row)
-        csv_content = output.getvalue()
-        output.close()
-        utf8_bom = '\ufeff'
-        csv_content_with_bom = utf8_bom + csv_content
+        # Snapshot so the generator is stable while streaming
+        entries = list(RATINGS_DATA)
+
+        async def generate_csv():
+            """Encode and yield rows incrementally instead of buffering the file."""
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            yield '\ufeff'.encode('utf-8')
+            writer.writerow(["timestamp", "session_id", "rating", "feedback", "language", "ticket_id"])
+            for i, rating_data in enumerate(entries, 1):
+                writer.writerow((
+                    rating_data["timestamp"],
+                    rating_data["session_id"],
+                    rating_data["rating"],
+                    rating_data["Feedback"],
+                    rating_data["language"],
+                    rating_data["ticket_id"],
+                ))
+                if i % 500 == 0:
+                    yield buffer.getvalue().encode('utf-8')
+                    buffer.seek(0)
+                    buffer.truncate(0)
+                    # Give the event loop a turn between chunks
+                    await asyncio.sleep(0)
+            yield buffer.getvalue().encode('utf-8')
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"maha_aastha_ratings_{timestamp}.csv"
         return StreamingResponse(
-            io.BytesIO(csv_content_with_bom.encode('utf-8')),
+            generate_csv(),
             media_type="text/csv; charset=utf-8",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
@@ -1100,7 +1313,7 @@ async def export_ratings():
         )
     except Exception as e:
         logger.error(f"CSV export error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": f"Failed to export ratings: {str(e)}"}
         )
@@ -1109,33 +1322,29 @@ async def export_ratings():
 async def get_rating_stats():
     """Get rating statistics."""
     try:
-        if not RATINGS_DATA:
+        total_ratings = RATING_STATS["count"]
+        if not total_ratings:
             return {
                 "total_ratings": 0,
                 "average_rating": 0,
                 "rating_distribution": {},
                 "language_distribution": {}
             }
-        total_ratings = len(RATINGS_DATA)
-        ratings = [entry["rating"] for entry in RATINGS_DATA]
-        average_rating = sum(ratings) / total_ratings if ratings else 0
-        rating_distribution = {}
-        for i in range(1, 6):
-            rating_distribution[str(i)] = ratings.count(i)
-        languages = [entry["language"] for entry in RATINGS_DATA]
-        language_distribution = {}
-        for lang in set(languages):
-            language_distribution[lang] = languages.count(lang)
+        # Served from the running aggregates maintained in save_rating_data,
+        # so this is O(1) instead of a scan over the history.
+        average_rating = RATING_STATS["sum"] / total_ratings
+        rating_distribution = {str(i): RATING_STATS["ratings"].get(i, 0) for i in range(1, 6)}
+        language_distribution = dict(RATING_STATS["languages"])
         return {
             "total_ratings": total_ratings,
             "average_rating": round(average_rating, 2),
             "rating_distribution": rating_distribution,
             "language_distribution": language_distribution,
-            "latest_ratings": RATINGS_DATA[-10:] if len(RATINGS_DATA) >= 10 else RATINGS_DATA
+            "latest_ratings": list(RATINGS_DATA)[-10:]
         }
     except Exception as e:
         logger.error(f"Rating stats error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": f"Failed to get rating statistics: {str(e)}"}
         )
@@ -1144,12 +1353,13 @@ async def get_rating_stats():
 async def health_check():
     """System health check endpoint with database connectivity."""
     try:
-        uptime = time.time() - SYSTEM_STATUS["startup_time"]
-        db_status = await test_db_connection() if SYSTEM_STATUS["database_connected"] else False
+        now = time.time()
+        uptime = now - SYSTEM_STATUS["startup_time"]
+        db_status = await cached_test_db_connection() if SYSTEM_STATUS["database_connected"] else False
         SYSTEM_STATUS["database_connected"] = db_status
         return {
             "status": "healthy" if db_status else "degraded",
-            "timestamp": time.time(),
+            "timestamp": now,
             "uptime_seconds": round(uptime, 2),
             "system_info": {
                 "active_sessions": len(CHAT_HISTORY),
@@ -1163,7 +1373,7 @@ async def health_check():
         }
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": "error",
@@ -1172,52 +1382,74 @@ async def health_check():
             }
         )
 
+# Static payloads for /suggestions/ and /languages/, encoded to JSON bytes
+# once at import; the routes wrap the cached bytes in a Response and skip
+# dict construction plus jsonable_encoder entirely.
+_SUGGESTIONS_BY_LANGUAGE = {
+    "en": [
+        "I want to register a ticket",
+        "Would you like to check the status of the ticket which you have registered on the Maha Aastha Grievance Redressal System?",
+        "Check status TKT-12345678",
+        "Has a Ticket already been registered on the Maha Aastha Grievance Redressal System?",
+        "Would you like to provide feedback regarding the resolution of your ticket addressed through the Maha Aastha Grievance Redressal System?"
+    ],
+    "mr": [
+        "मला तिकीट नोंदवायची आहे",
+        "आपण महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदवलेल्या तिकीटची स्थिती तपासू इच्छिता का?",
+        "स्थिती तपासा TKT-12345678",
+        "महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदविण्यात आलेली तिकीट आहे का?",
+        "आपल्या तिकीटच्या निराकरणाबाबत अभिप्राय द्यायला इच्छिता का?"
+    ]
+}
+
+_SUGGESTIONS_JSON = {
+    lang: orjson.dumps({"suggestions": s, "language": lang, "total": len(s)})
+    for lang, s in _SUGGESTIONS_BY_LANGUAGE.items()
+}
+
+_LANGUAGES_JSON = orjson.dumps({
+    "supported_languages": SUPPORTED_LANGUAGES,
+    "language_details": {
+        "en": {"name": "English", "native_name": "English"},
+        "mr": {"name": "Marathi", "native_name": "मराठी"}
+    }
+})
+
 @app.get("/suggestions/")
 async def get_suggestions(language: str = "en"):
     """Get suggested queries."""
-    suggestions_by_language = {
-        "en": [
-            "I want to register a ticket",
-            "Would you like to check the status of the ticket which you have registered on the Maha Aastha Grievance Redressal System?",
-            "Check status TKT-12345678",
-            "Has a Ticket already been registered on the Maha Aastha Grievance Redressal System?",
-            "Would you like to provide feedback regarding the resolution of your ticket addressed through the Maha Aastha Grievance Redressal System?"
-        ],
-        "mr": [
-            "मला तिकीट नोंदवायची आहे",
-            "आपण महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदवलेल्या तिकीटची स्थिती तपासू इच्छिता का?",
-            "स्थिती तपासा TKT-12345678",
-            "महा आस्था तक्रार निवारण प्रणालीमध्ये नोंदविण्यात आलेली तिकीट आहे का?",
-            "आपल्या तिकीटच्या निराकरणाबाबत अभिप्राय द्यायला इच्छिता का?"
-        ]
-    }
-    suggestions = suggestions_by_language.get(language, suggestions_by_language["en"])
-    return {
-        "suggestions": suggestions,
-        "language": language,
-        "total": len(suggestions)
-    }
+    content = _SUGGESTIONS_JSON.get(language, _SUGGESTIONS_JSON["en"])
+    return Response(content=content, media_type="application/json")
 
 @app.get("/languages/")
 async def get_supported_languages():
     """Get list of supported languages."""
-    return {
-        "supported_languages": SUPPORTED_LANGUAGES,
-        "language_details": {
-            "en": {"name": "English", "native_name": "English"},
-            "mr": {"name": "Marathi", "native_name": "मराठी"}
-        }
-    }
+    return Response(content=_LANGUAGES_JSON, media_type="application/json")
 
 @app.get("/debug/sessions")
-async def debug_sessions():
-    """Debugs endpoint to check current session states."""
+async def debug_sessions(limit: int = 50, offset: int = 0):
+    """Debugs endpoint to check current session states (paginated)."""
+    # Serialize only the requested slice — dumping the whole store is an
+    # O(N) JSON-encoding spike once the session cache fills up.
+    limit = max(0, min(limit, 500))
+    offset = max(0, offset)
+    sessions = dict(islice(USER_SESSION_STATE.items(), offset, offset + limit))
     return {
         "total_sessions": len(USER_SESSION_STATE),
-        "sessions": USER_SESSION_STATE,
-        "timestamp": datetime.now().isoformat()
+        "limit": limit,
+        "offset": offset,
+        "sessions": sessions,
+        "timestamp": _now_iso()
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    uvicorn.run(
+        "fastapp:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
+    )
\ No newline at end of file